@@ -39,7 +39,11 @@ setuptools.setup(
     packages=[i.__name__],
     python_requires='>=3.8',
     install_requires=install_requires,
-    extras_require={'pyyaml': ['PyYAML>=6.0,<7.0']},
+    extras_require={
+        'pyyaml': ['PyYAML>=6.0,<7.0'],
+        'blake3': ['blake3>=0.4,<2.0'],
+        'mmh3':   ['mmh3>=4.0,<6.0']
+    },
     classifiers=[
         'Development Status :: 4 - Beta',
         'Intended Audience :: Developers',
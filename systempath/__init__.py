@@ -46,13 +46,14 @@ import typing
 
 from typing import (
     Type, TypeVar, Literal, Optional, Union, Dict, Tuple, List, Mapping,
-    BinaryIO, TextIO, Callable, Sequence, Iterator, Iterable, Any
+    BinaryIO, TextIO, Callable, Sequence, Iterator, Iterable, NamedTuple, Any
 )
 
 if typing.TYPE_CHECKING:
     import csv
     import json
     import yaml
+    from array import array
     from _typeshed import SupportsWrite
     from configparser import ConfigParser, Interpolation
 
@@ -66,7 +67,10 @@ if sys.version_info >= (3, 11):
 else:
     Self = TypeVar('Self')
 
-__all__ = ['SystemPath', 'Path', 'Directory', 'File', 'Open', 'Content', 'tree']
+__all__ = [
+    'SystemPath', 'Path', 'Directory', 'File', 'Open', 'Content', 'tree',
+    'AsyncPath'
+]
 
 BytesOrStr:     TypeAlias = TypeVar('BytesOrStr', bytes, str)
 PathLink:       TypeAlias = BytesOrStr
@@ -76,6 +80,9 @@ FileNewline:    TypeAlias = Literal['', '\n', '\r', '\r\n']
 CopyFunction:   TypeAlias = Callable[[PathLink, PathLink], None]
 CopyTreeIgnore: TypeAlias = \
     Callable[[PathLink, List[BytesOrStr]], List[BytesOrStr]]
+DirEntryIgnore: TypeAlias = \
+    Callable[[PathLink, List[os.DirEntry]], Iterable[BytesOrStr]]
+NamePatterns:   TypeAlias = Union[BytesOrStr, Iterable[BytesOrStr]]
 
 ConvertersMap:       TypeAlias = Dict[str, Callable[[str], Any]]
 CSVDialectLike:      TypeAlias = Union[str, 'csv.Dialect', Type['csv.Dialect']]
@@ -119,6 +126,13 @@ class CSVWriter:
     def writerows(self, rows: Iterable[Iterable[Any]]) -> None: ...
 
 
+class WalkArrays(NamedTuple):
+    paths:    List[PathLink]
+    st_mode:  'array[int]'
+    st_size:  'array[int]'
+    st_mtime: 'array[float]'
+
+
 class Path:
 
     def __init__(
@@ -128,7 +142,8 @@ class Path:
             autoabs:         Optional[bool] = None,
             strict:          Optional[bool] = None,
             dir_fd:          Optional[int]  = None,
-            follow_symlinks: Optional[bool] = None
+            follow_symlinks: Optional[bool] = None,
+            cache_stat:      Optional[bool] = None
     ):
         """
         @param name
@@ -180,6 +195,15 @@ class Path:
 
             This parameter may not be available on your platform, using them
             will raise `NotImplementedError` if unavailable.
+
+        @param cache_stat
+            Set to True to cache the results of `self.stat` and `self.lstat` on
+            the instance, so that consulting several predicates (`exists`,
+            `isdir`, `isfile`, ...) costs a single system call. The default is
+            False. Failed calls are never cached. The cache is dropped when the
+            instance renames, deletes or changes the path through its own
+            methods, otherwise call `self.clear_cache` after the path changed
+            on disk.
         """
         if strict and not os.path.exists(name):
             raise SystemPathNotFoundError
@@ -188,6 +212,7 @@ class Path:
         self.strict          = strict
         self.dir_fd          = dir_fd
         self.follow_symlinks = follow_symlinks
+        self.cache_stat      = cache_stat
 
     def __bytes__(self) -> bytes:
         """Return the path of type bytes."""
@@ -243,8 +268,11 @@ class Path:
 
     def dirnamel(self, level: int) -> 'Directory':
         """Like `self.dirname`, and can specify the directory level."""
+        directory: PathLink = self.name
+        for _ in range(level):
+            directory: PathLink = os.path.dirname(directory)
         return Directory(
-            self.name.rsplit(os.sep, maxsplit=level)[0],
+            directory,
             strict=self.strict,
             dir_fd=self.dir_fd,
             follow_symlinks=self.follow_symlinks
@@ -364,6 +392,19 @@ class Path:
     def executable(self) -> bool:
         return self.access(os.X_OK)
 
+    def permissions(self, *, effective_ids: Optional[bool] = None) -> int:
+        """
+        Get the access permissions of the current user to the path at once,
+        return a bit mask like the mode bits: 4 readable, 2 writeable and 1
+        executable (7 means all). If all are granted it costs a single system
+        call, instead of one per `self.readable`, `self.writeable` and
+        `self.executable`.
+
+        @param effective_ids
+            Use the effective uid/gid instead of the real uid/gid, for more
+            instructions see `self.access`. The default is False.
+        """
+
     def delete(
             self,
             *,
@@ -461,7 +502,9 @@ class Path:
 
         @param copy_function
             The optional parameter `copy_function` will be passed directly to
-            `shutil.move` and default value is `shutil.copy2`.
+            `shutil.move`. The default behaves like `shutil.copy2`, but on Linux
+            copies the data with `os.copy_file_range`, which may clone it on
+            copy-on-write file systems (Btrfs, XFS).
 
         Backstory about providing this method
             https://github.com/gqylpy/systempath/issues/1
@@ -568,9 +611,67 @@ class Path:
     def lstat(self) -> os.stat_result:
         """Get the status of the file or directory, like `self.stat`, but do not
         follow symbolic links."""
-        return self.__class__(
-            self.name, dir_fd=self.dir_fd, follow_symlinks=False
-        ).stat
+        return os.lstat(self, dir_fd=self.dir_fd)
+
+    def clear_cache(self) -> None:
+        """Drop the status results cached by the initialization parameter
+        `cache_stat`, the next access performs the system call again."""
+
+    @staticmethod
+    def stat_many(
+            paths:           Iterable[Union[PathType, PathLink]],
+            /, *,
+            follow_symlinks: Optional[bool] = None,
+            workers:         Optional[int]  = None
+    ) -> List[Optional[os.stat_result]]:
+        """
+        Get the status of many paths at once, the system calls are issued
+        concurrently from a thread pool, so that their latency overlaps. Most
+        useful on network file systems, where every call waits on the server.
+
+        @param paths
+            The path instances or path links to get the status of.
+
+        @param follow_symlinks
+            Whether to follow symbolic links, the default is True.
+
+        @param workers
+            The maximum number of concurrent calls, the default is 16. Set to 1
+            to issue the calls one by one in the current thread.
+
+        @return
+            A list of `os.stat_result` in the order of `paths`, with None in
+            place of the paths that do not exist (or are broken symlinks).
+        """
+
+    @staticmethod
+    def enable_exists_cache(
+            ttl: Optional[float] = None, *, maxsize: Optional[int] = None
+    ) -> None:
+        """
+        Cache the results of `exists`, `lexists`, `isdir` and `isfile` for all
+        path instances for a short time, keyed by the path link, `dir_fd` and
+        `follow_symlinks`. Useful when the same (often missing) paths are probed
+        many times per second. Disabled by default.
+
+        Any method of this package that creates, removes or renames a path drops
+        the whole cache, changes made by other means are visible after at most
+        `ttl` seconds, or call `self.clear_cache` to drop the cache at once.
+        So does `Directory.chdir`, but after changing the working directory by
+        other means (e.g. `os.chdir`) call `self.clear_cache`, the relative path
+        links are cached as they are.
+
+        @param ttl
+            How many seconds a result is reused, the default is 1.0.
+
+        @param maxsize
+            The maximum number of cached results, the oldest result is evicted
+            first. The default is 4096.
+        """
+
+    @staticmethod
+    def disable_exists_cache() -> None:
+        """Disable and drop the cache enabled by `Path.enable_exists_cache`."""
 
     def getsize(self) -> int:
         """Get the size of the file, return 0 if the path is a directory."""
@@ -725,8 +826,9 @@ class Path:
 
         def chattr(self, operator: Literal['+', '-', '='], attrs: str) -> None:
             """
-            Change the hidden attributes of the file or directory, call the Unix
-            system command `chattr` internally.
+            Change the hidden attributes of the file or directory. On Linux the
+            flags are changed through `ioctl(FS_IOC_SETFLAGS)` directly as the
+            system command `chattr` does, other systems call `chattr`.
 
             @param operator
                 Specify an operator "+", "-", or "=". Used with the parameter
@@ -758,20 +860,21 @@ class Path:
                 More attributes that are rarely used (or no longer used), you
                 can refer to the manual of the Unix system command `chattr`.
 
-            Use Warning, the implementation of method `chattr` is to directly
-            call the system command `chattr`, so this is very unreliable. Also,
-            do not attempt to modify hidden attributes of important files and
-            directories in your system, this may cause your system failure,
-            unable to start!
+            The attributes "E", "I", "N" and "V" can only be listed, and are
+            kept (together with "e") when the operator is "=". Raise
+            `ChattrError` if the file system does not support the attributes.
+
+            Use Warning, do not attempt to modify hidden attributes of important
+            files and directories in your system, this may cause your system
+            failure, unable to start!
             """
 
         def lsattr(self) -> str:
             """
-            Get the hidden attributes of the file or directory, call the Unix
-            system command `lsattr` internally.
-
-            Use Warning, the implementation of method `lsattr` is to directly
-            call the system command `lsattr`, so this is very unreliable.
+            Get the hidden attributes of the file or directory, in the format
+            of the system command `lsattr`, e.g. "--------------e-------". On
+            Linux the flags are read through `ioctl(FS_IOC_GETFLAGS)` directly,
+            other systems call `lsattr`.
             """
 
         def exattr(self, attr: str, /) -> bool:
@@ -887,7 +990,9 @@ class Directory(Path):
     @property
     def subpaths(self) -> Iterator[Union['Directory', 'File', Path]]:
         """Get the instances of `Directory` or `File` for all subpaths (single
-        layer) in the directory."""
+        layer) in the directory. If the directory was created with `cache_stat`
+        the subpaths are too, and their cache is filled with the status that
+        `os.scandir` reports, a snapshot taken while listing the directory."""
 
     @property
     def subpath_names(self) -> List[BytesOrStr]:
@@ -901,11 +1006,13 @@ class Directory(Path):
     def tree(
             self,
             *,
-            level:     Optional[int]  = None,
-            downtop:   Optional[bool] = None,
-            omit_dir:  Optional[bool] = None,
-            pure_path: Optional[bool] = None,
-            shortpath: Optional[bool] = None
+            level:     Optional[int]          = None,
+            downtop:   Optional[bool]         = None,
+            omit_dir:  Optional[bool]         = None,
+            pure_path: Optional[bool]         = None,
+            shortpath: Optional[bool]         = None,
+            include:   Optional[NamePatterns] = None,
+            exclude:   Optional[NamePatterns] = None
     ) -> Iterator[Union[Path, PathLink]]:
         return tree(
             self.name,
@@ -913,7 +1020,9 @@ class Directory(Path):
             downtop  =downtop,
             omit_dir =omit_dir,
             pure_path=pure_path,
-            shortpath=shortpath
+            shortpath=shortpath,
+            include  =include,
+            exclude  =exclude
         )
 
     def walk(
@@ -938,6 +1047,29 @@ class Directory(Path):
             An optional error handler, for more instructions see `os.walk`.
         """
 
+    def walk_arrays(self, *, level: Optional[int] = None) -> WalkArrays:
+        """
+        Recurse the directory and collect the path, mode, size and modification
+        time of every subdirectory and file, as parallel columns instead of one
+        object per path. The numeric columns are `array.array` instances, which
+        support the buffer protocol, so they can be viewed without copying by
+        tools like NumPy (`numpy.frombuffer(result.st_size, 'q')`) for
+        vectorized filtering and aggregation.
+
+            >>> r = Directory('/var/log').walk_arrays()
+            >>> sum(size for mode, size in zip(r.st_mode, r.st_size)
+            ...     if stat.S_ISREG(mode))
+
+        Symbolic links are stated according to `self.follow_symlinks` but never
+        recursed into, paths that cannot be read or stated are skipped.
+
+        @param level
+            Recursion depth of the directory, default is deepest.
+
+        @return: WalkArrays(paths, st_mode, st_size, st_mtime), all columns are
+                 in the same order.
+        """
+
     def search(
             self,
             slicing:   BytesOrStr,
@@ -984,12 +1116,18 @@ class Directory(Path):
             /, *,
             symlinks:                 Optional[bool]               = None,
             ignore:                   Optional[CopyTreeIgnore]     = None,
+            ignore_entries:           Optional[DirEntryIgnore]     = None,
             copy_function:            Optional[CopyFunction]       = None,
             ignore_dangling_symlinks: Optional[bool]               = None,
-            dirs_exist_ok:            Optional[bool]               = None
+            dirs_exist_ok:            Optional[bool]               = None,
+            workers:                  Optional[int]                = None
     ) -> Union['Directory', PathLink]:
         """
-        Copy the directory tree recursively, call `shutil.copytree` internally.
+        Copy the directory tree recursively, the same as `shutil.copytree`.
+        The files are copied concurrently in a thread pool, which overlaps the
+        system calls of many small files, the directories and symbolic links are
+        still created in order. The metadata of the directories is copied after
+        all the files, so that read-only directories can be copied too.
 
         @param dst
             Where to copy the directory, hopefully pass in an instance of
@@ -1028,9 +1166,20 @@ class Directory(Path):
 
             For more instructions see `shutil.copytree`.
 
+        @param ignore_entries
+            Same as parameter `ignore`, but called with a list of `os.DirEntry`
+            instead of names, so that the entries can be filtered by their type
+            (`entry.is_dir()`) or status (`entry.stat()`) without a `stat` call
+            per name. Returns the names that should not be copied. Can be used
+            together with `ignore`, the names returned by both are ignored.
+
+                >>> def func(src: PathLink, entries: List[os.DirEntry]):
+                >>>     return [x.name for x in entries if x.stat().st_size > N]
+
         @param copy_function
-            The optional parameter `copy_function` will be passed directly to
-            `shutil.copytree` and default value is `shutil.copy2`.
+            The function used to copy each file, the default behaves like
+            `shutil.copy2` (see `Path.move`). It is called from multiple
+            threads, so it must be thread-safe.
 
         @param ignore_dangling_symlinks
             Used to ignore exceptions raised by symbolic link errors, use with
@@ -1042,15 +1191,40 @@ class Directory(Path):
             can set this parameter to True to silence the exception and
             overwrite the files in the target. Default is False.
 
+        @param workers
+            The maximum number of files copied at the same time, the default is
+            4 per CPU, at most 32. Set to 1 to call `shutil.copytree` only, the
+            files are then copied one by one in the current thread.
+
         @return: The parameter `dst` is passed in, without any modification.
         """
 
-    def clear(self) -> None:
+    def clear(
+            self,
+            *,
+            ignore_errors: Optional[bool]     = None,
+            onerror:       Optional[Callable] = None,
+            workers:       Optional[int]      = None
+    ) -> None:
         """
         Clear the directory.
 
         Traverse everything in the directory and delete it, call `self.rmtree`
         for the directories and `File.remove` for the files (or anything else).
+
+        @param ignore_errors
+            Ignore the errors of listing the directory and deleting what is in
+            it, the same as `shutil.rmtree`. The default is False.
+
+        @param onerror
+            An optional error handler of listing the directory and deleting
+            what is in it, described more see `shutil.rmtree`. It may be called
+            from multiple threads.
+
+        @param workers
+            The maximum number of directories deleted at the same time, the
+            default is 8. Set to 1 to delete them one by one in the current
+            thread.
         """
 
     def mkdir(
@@ -1115,11 +1289,14 @@ class Directory(Path):
     def rmtree(
             self,
             *,
-            ignore_errors: Optional[bool] = None,
-            onerror: Optional[Callable] = None
+            ignore_errors: Optional[bool]     = None,
+            onerror:       Optional[Callable] = None,
+            workers:       Optional[int]      = None
     ) -> None:
         """
         Delete the directory tree recursively, call `shutil.rmtree` internally.
+        The top-level subdirectories are deleted concurrently (see
+        `self.clear`), unless `ignore_errors` or `onerror` is given.
 
         @param ignore_errors
             If the directory does not exist will raise `FileNotFoundError`, can
@@ -1128,6 +1305,10 @@ class Directory(Path):
 
         @param onerror
             An optional error handler, described more see `shutil.rmtree`.
+
+        @param workers
+            The maximum number of subdirectories deleted at the same time, the
+            default is 8. Set to 1 to call `shutil.rmtree` only.
         """
 
     def chdir(self) -> None:
@@ -1197,7 +1378,10 @@ class File(Path):
 
     def copy(self, dst: Union['File', PathLink], /) -> Union['File', PathLink]:
         """
-        Copy the file to another location, call `shutil.copyfile` internally.
+        Copy the file to another location, behaves like `shutil.copyfile`. On
+        Linux the data is copied with `os.copy_file_range` (in kernel space, and
+        shares the extents on copy-on-write file systems such as Btrfs or XFS),
+        elsewhere `shutil.copyfile` is called.
 
         @param dst:
             Where to copy the file, hopefully pass in an instance of `File`, can
@@ -1226,8 +1410,10 @@ class File(Path):
             handle), it must have at least writable or append permission.
 
         @param bufsize
-            The buffer size, the length of each copy, default is 64K (if your
-            platform is Windows then 1M). Passing -1 turns off buffering.
+            The buffer size, the length of each copy, default is 256K (1M if
+            your platform is Windows). Only used when `dst` is a stream,
+            between two files the data is copied in kernel space where the
+            platform allows (`copy_file_range` or `sendfile`).
 
         @return: The parameter `dst` is passed in, without any modification.
         """
@@ -1264,7 +1450,7 @@ class File(Path):
     ) -> None:
         """
         Create the file, call `os.mknod` internally, but if your platform is
-        Windows then internally call `open(self.name, 'x')`.
+        Windows then internally call `os.open` with `O_CREAT | O_EXCL`.
 
         @param mode
             Specify the access permissions of the file, can be a permission
@@ -1290,8 +1476,9 @@ class File(Path):
             ignore_exists: Optional[bool] = None
     ) -> None:
         """Create the file and all intermediate paths, super version of
-        `self.mknod`."""
-        self.dirname.makedirs(mode, exist_ok=True)
+        `self.mknod`. The intermediate directories are created with the
+        default mode."""
+        self.dirname.makedirs(exist_ok=True)
         self.mknod(mode, device=device, ignore_exists=ignore_exists)
 
     def create(
@@ -1345,6 +1532,12 @@ class File(Path):
     def md5(self, salting: Optional[bytes] = None) -> str:
         return self.contents.md5(salting)
 
+    def blake3(self, salting: Optional[bytes] = None) -> str:
+        return self.contents.blake3(salting)
+
+    def murmur3(self, seed: Optional[int] = None) -> str:
+        return self.contents.murmur3(seed)
+
     def read(
             self,
             size: Optional[int] = None,
@@ -1656,6 +1849,31 @@ class Open:
             opener:         Optional[FileOpener]  = None
     ) -> TextIO: ...
 
+    def copy_to(
+            self,
+            dst:    Union[File, PathLink],
+            /, *,
+            length: Optional[int] = None
+    ) -> int:
+        """
+        Copy the file to another file, the destination file is created if it
+        does not exist, truncated if it does.
+
+        The data is copied in kernel space where your platform allows (call
+        `os.copy_file_range` or `os.sendfile` internally), so it does not need
+        to be read into memory first. Otherwise fall back to a read/write loop.
+
+        @param dst
+            Where to copy the file, hopefully pass in an instance of `File`, can
+            also pass in a file path link.
+
+        @param length
+            Copy at most this many bytes from the beginning of the file. The
+            default is to copy the entire file.
+
+        @return: The number of bytes copied.
+        """
+
 
 class Content:
     """Pass in an instance of `File` (or a file path link) to get a file content
@@ -1672,7 +1890,9 @@ class Content:
         self.write(other)
         return self
 
-    def __iadd__(self, other: Union['Content', bytes], /) -> Self:
+    def __iadd__(
+            self, other: Union['Content', bytes, Sequence[bytes]], /
+    ) -> Self:
         self.append(other)
         return self
 
@@ -1708,9 +1928,12 @@ class Content:
         )
         return self.write(content)
 
-    def append(self, content: Union['Content', bytes], /) -> int:
+    def append(
+            self, content: Union['Content', bytes, Sequence[bytes]], /
+    ) -> int:
         """Append the another file contents (or a bytes object) to the current
-        file."""
+        file. A list (or tuple) of bytes objects is appended in order with one
+        system call (`os.writev`) where available."""
 
     def contains(self, subcontent: bytes, /) -> bool:
         """Return True if the current file content contain `subcontent` else
@@ -1731,8 +1954,10 @@ class Content:
             called handle), it must have at least writable or append permission.
 
         @param bufsize
-            The buffer size, the length of each copy, default is 64K (if your
-            platform is Windows then 1M). Passing -1 turns off buffering.
+            The buffer size, the length of each copy, default is 256K (1M if
+            your platform is Windows). Only used when `dst` is a stream,
+            between two files the data is copied in kernel space where the
+            platform allows (`copy_file_range` or `sendfile`).
         """
 
     def truncate(self, length: int, /) -> None:
@@ -1744,15 +1969,70 @@ class Content:
     def md5(self, salting: Optional[bytes] = None) -> str:
         """Return the md5 string of the file content."""
 
+    def blake3(self, salting: Optional[bytes] = None) -> str:
+        """
+        Return the BLAKE3 string of the file content, much faster than md5 and
+        still cryptographically secure. The file is memory-mapped and hashed
+        by multiple threads.
+
+        The third-party library `blake3` is required, install it with
+        `pip install systempath[blake3]`.
+
+        @param salting
+            Hashed before the file content, the default is none. Unlike md5, it
+            is not used as a key.
+        """
+
+    def murmur3(self, seed: Optional[int] = None) -> str:
+        """
+        Return the MurmurHash3 (x64, 128-bit) string of the file content. It is
+        not cryptographic, use it only to identify or deduplicate contents,
+        where it is faster than md5 and BLAKE3.
+
+        The third-party library `mmh3` is required, install it with
+        `pip install systempath[mmh3]`.
+
+        @param seed
+            The seed of the hash, the default is 0.
+        """
+
+    @staticmethod
+    def md5_many(
+            files:   Iterable[Union['File', PathLink]],
+            /, *,
+            salting: Optional[bytes] = None,
+            workers: Optional[int]   = None
+    ) -> List[str]:
+        """
+        Return the md5 strings of the contents of many files at once. The files
+        are hashed concurrently from a thread pool, `hashlib` releases the GIL
+        while hashing, so that a walk that hashes every file is not limited to
+        one core.
+
+        @param files
+            The file instances or file links to hash.
+
+        @param salting
+            Prepended to the content of every file, the default is none.
+
+        @param workers
+            The maximum number of files hashed at the same time, the default is
+            8. Set to 1 to hash the files one by one in the current thread.
+
+        @return: A list of md5 strings in the order of `files`.
+        """
+
 
 def tree(
-        dirpath:   Optional[PathLink] = None,
+        dirpath:   Optional[PathLink]     = None,
         /, *,
-        level:     Optional[int]      = None,
-        downtop:   Optional[bool]     = None,
-        omit_dir:  Optional[bool]     = None,
-        pure_path: Optional[bool]     = None,
-        shortpath: Optional[bool]     = None
+        level:     Optional[int]          = None,
+        downtop:   Optional[bool]         = None,
+        omit_dir:  Optional[bool]         = None,
+        pure_path: Optional[bool]         = None,
+        shortpath: Optional[bool]         = None,
+        include:   Optional[NamePatterns] = None,
+        exclude:   Optional[NamePatterns] = None
 ) -> Iterator[Union[Path, PathLink]]:
     """
     Directory tree generator, recurse the directory to get all subdirectories
@@ -1785,7 +2065,51 @@ def tree(
     @param shortpath
         Yield short path link string, delete the `dirpath` from the left end of
         the path, used with the parameter `pure_path`. The default is False.
+
+    @param include
+        Shell-style patterns (e.g. "*.py"), or a single one, matched against
+        the name of each subpath. Only the matching subpaths are yielded,
+        all subdirectories are still recursed. The default is to yield all.
+
+    @param exclude
+        Shell-style patterns (e.g. "__pycache__"), or a single one, matched
+        against the name of each subpath. The matching subpaths are neither
+        yielded nor recursed. Matching is case-insensitive on Windows only,
+        all patterns are compiled into one regular expression beforehand.
+    """
+
+
+class AsyncPath:
     """
+    Wrap a path instance for use in asyncio code, every blocking call is run in
+    the default thread pool executor of the running event loop, so that system
+    calls do not stall the loop.
+
+        >>> p = AsyncPath(Directory('/tmp'))
+
+        >>> await p.exists                # Properties are awaited.
+        True
+
+        >>> await p.mkdir(ignore_exists=True)
+
+        >>> async for subpath in p.tree(level=2):
+        ...     ...
+
+    Methods returning iterators (`tree`, `walk`, `search`, `scandir`,
+    `subpaths`) and the instance itself are async iterables, items are pulled
+    from the thread pool in batches. Plain attributes (`name`, `dir_fd`, ...)
+    are returned as they are. Property setters are not supported, call the
+    corresponding methods (e.g. `write`) instead.
+
+    A thread pool is not the most efficient way to do file I/O, but it is
+    portable and needs no third-party library.
+
+    @param path
+        A path instance, or a path link to create a `SystemPath` from.
+    """
+
+    def __init__(self, path: Union[PathType, PathLink], /):
+        self.path = path
 
 
 class INI:
@@ -2277,11 +2601,14 @@ class _xe6_xad_x8c_xe7_x90_xaa_xe6_x80_xa1_xe7_x8e_xb2_xe8_x90_x8d_xe4_xba_x91:
     gpack = globals()
     gpath = f'{__name__}.i {__name__}'
     gcode = __import__(gpath, fromlist=...)
+    gdict = gcode.__dict__
 
     for gname in gpack:
         if gname[0] != '_':
-            gfunc = getattr(gcode, gname, None)
-            if gfunc and getattr(gfunc, '__module__', None) == gpath:
+            gfunc = gdict.get(gname)
+            if gfunc is None or not hasattr(gfunc, '__module__'):
+                continue
+            if gfunc.__module__ == gpath:
                 gfunc.__module__ = __package__
                 gfunc.__doc__ = gpack[gname].__doc__
                 gpack[gname] = gfunc
@@ -14,41 +14,76 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 import sys
-import csv
-import json
 import typing
-import hashlib
 import builtins
-import warnings
 import functools
 
 from copy import copy, deepcopy
-from configparser import ConfigParser
+from types import MemberDescriptorType
+from itertools import islice
+from time import monotonic
+from threading import Lock, local
 
 from os import (
-    stat,    lstat,   stat_result,
+    stat,    lstat,   stat_result, DirEntry,
     rename,  renames, replace,     remove,
     chmod,   access,  truncate,    utime,
     link,    symlink, unlink,      readlink,
     listdir, scandir, walk,        chdir,
     mkdir,   rmdir,   makedirs,    removedirs,
-    getcwd,  getcwdb
+    getcwd,  getcwdb, cpu_count,   fsencode, fsdecode,
+    fstat,   ftruncate, fspath,
+    O_WRONLY, O_CREAT, O_APPEND, O_EXCL, O_TRUNC,
+    open  as osopen,
+    close as osclose,
+    write as oswrite
 )
 
+try:
+    from os import copy_file_range
+except ImportError:
+    copy_file_range = None
+
+if sys.platform == 'linux':
+    # Only Linux can `sendfile` between two regular files, others (e.g. macOS)
+    # require the destination to be a socket.
+    from os import sendfile
+else:
+    sendfile = None
+
+try:
+    from os import writev
+except ImportError:
+    writev = None
+
+try:
+    from os import O_BINARY
+except ImportError:
+    O_BINARY = 0
+
+try:
+    from os import posix_fadvise, POSIX_FADV_SEQUENTIAL
+except ImportError:
+    posix_fadvise = None
+
+from errno import EXDEV, EINVAL, ENOSYS, EBADF, ETXTBSY, EOPNOTSUPP
+from errno import EPERM, EACCES
+
 if sys.platform != 'win32':
-    from os import mknod, chown, system, popen
+    from os import mknod, chown, geteuid
 
     if sys.platform == 'linux':
+        from os import O_RDONLY, O_NONBLOCK, O_CLOEXEC
+        from fcntl import ioctl
         try:
             from os import getxattr, setxattr, listxattr, removexattr
         except ImportError:
             def getxattr(*a, **kw): raise NotImplementedError
             setxattr = listxattr = removexattr = getxattr
     try:
-        from os import lchmod, lchown, chflags, lchflags
+        from os import chflags
     except ImportError:
-        def lchmod(*a, **kw): raise NotImplementedError
-        lchown = chflags = lchflags = lchmod
+        def chflags(*a, **kw): raise NotImplementedError
     try:
         from pwd import getpwuid
         from grp import getgrgid
@@ -56,26 +91,46 @@ if sys.platform != 'win32':
         def getpwuid(_): raise NotImplementedError
         getgrgid = getpwuid
 
-    READ_BUFSIZE = 1024 * 64
+    # Scale the read buffer with the physical memory (as systemd does), small
+    # machines should not pay for large short-lived buffers: 8K up to 128M of
+    # memory, 16K up to 512M, 32K below 2G, 64K below 8G, otherwise 128K (as
+    # coreutils `cp` reads).
+    try:
+        from os import sysconf
+        physmem: int = sysconf('SC_PHYS_PAGES') * sysconf('SC_PAGE_SIZE')
+    except (ImportError, ValueError, OSError):
+        physmem = 1 << 31
+
+    READ_BUFSIZE = 1024 * (
+        8  if physmem <= 1 << 27 else
+        16 if physmem <= 1 << 29 else
+        32 if physmem <  1 << 31 else
+        64 if physmem <  1 << 33 else 128
+    )
+    COPY_BUFSIZE = 1024 * 256
+
+    del physmem
 else:
-    READ_BUFSIZE = 1024 * 1024
+    READ_BUFSIZE = COPY_BUFSIZE = 1024 * 1024
 
 from os.path import (
     basename, dirname,    abspath,    realpath,   relpath,
     normpath, expanduser, expandvars,
-    join,     split,      splitext,   splitdrive, sep,
-    isabs,    exists,     isdir,      isfile,     islink,  ismount,
-    getctime, getmtime,   getatime,   getsize
+    join,     split,      splitdrive, sep,
+    isabs,    exists,     isdir,      isfile,     ismount,    getsize
 )
 
 from shutil import move, copyfile, copytree, copystat, copymode, copy2, rmtree
+from shutil import copyfileobj
+from shutil import Error as ShutilError, SameFileError, SpecialFileError
 
 from stat import (
     S_ISDIR  as s_isdir,
     S_ISREG  as s_isreg,
     S_ISBLK  as s_isblk,
     S_ISCHR  as s_ischr,
-    S_ISFIFO as s_isfifo
+    S_ISFIFO as s_isfifo,
+    S_ISLNK  as s_islnk
 )
 
 from _io import (
@@ -86,12 +141,17 @@ from _io import (
 
 from typing import (
     TypeVar, Type, Final, Literal, Optional, Union, Dict, Tuple, List, Mapping,
-    Callable, Iterator, Iterable, Sequence, NoReturn, Any
+    Callable, Iterator, Iterable, Sequence, AsyncIterator, Awaitable, NoReturn,
+    NamedTuple, Set, Any
 )
 
 if typing.TYPE_CHECKING:
+    import csv
+    import json
+    import yaml
+    from array import array
     from _typeshed import SupportsWrite
-    from configparser import Interpolation
+    from configparser import ConfigParser, Interpolation
 
 if sys.version_info >= (3, 9):
     from typing import Annotated
@@ -111,24 +171,6 @@ if sys.version_info >= (3, 11):
 else:
     Self = TypeVar('Self')
 
-try:
-    import yaml
-except ModuleNotFoundError:
-    yaml = None
-else:
-    YamlLoader: TypeAlias = Union[
-        Type[yaml.BaseLoader],
-        Type[yaml.Loader],
-        Type[yaml.FullLoader],
-        Type[yaml.SafeLoader],
-        Type[yaml.UnsafeLoader]
-    ]
-    YamlDumper: TypeAlias = Union[
-        Type[yaml.BaseDumper],
-        Type[yaml.Dumper],
-        Type[yaml.SafeDumper]
-    ]
-
 if basename(sys.argv[0]) != 'setup.py':
     import exceptionx as ex
 
@@ -139,15 +181,26 @@ Closure:        TypeAlias = TypeVar('Closure', bound=Callable)
 CopyFunction:   TypeAlias = Callable[[PathLink, PathLink], None]
 CopyTreeIgnore: TypeAlias = \
     Callable[[PathLink, List[BytesOrStr]], List[BytesOrStr]]
+DirEntryIgnore: TypeAlias = \
+    Callable[[PathLink, List[DirEntry]], Iterable[BytesOrStr]]
+NamePatterns:   TypeAlias = Union[BytesOrStr, Iterable[BytesOrStr]]
 
 ConvertersMap:       TypeAlias = Dict[str, Callable[[str], Any]]
-CSVDialectLike:      TypeAlias = Union[str, csv.Dialect, Type[csv.Dialect]]
+CSVDialectLike:      TypeAlias = Union[str, 'csv.Dialect', Type['csv.Dialect']]
 JsonObjectHook:      TypeAlias = Callable[[Dict[Any, Any]], Any]
 JsonObjectParse:     TypeAlias = Callable[[str], Any]
 JsonObjectPairsHook: TypeAlias = Callable[[List[Tuple[Any, Any]]], Any]
 FileNewline:         TypeAlias = Literal['', '\n', '\r', '\r\n']
 YamlDumpStyle:       TypeAlias = Literal['|', '>', '|+', '>+']
 
+YamlLoader: TypeAlias = Union[
+    Type['yaml.BaseLoader'], Type['yaml.Loader'], Type['yaml.FullLoader'],
+    Type['yaml.SafeLoader'], Type['yaml.UnsafeLoader']
+]
+YamlDumper: TypeAlias = Union[
+    Type['yaml.BaseDumper'], Type['yaml.Dumper'], Type['yaml.SafeDumper']
+]
+
 OpenMode: TypeAlias = Annotated[Literal[
     'rb', 'rb_plus', 'rt', 'rt_plus', 'r', 'r_plus',
     'wb', 'wb_plus', 'wt', 'wt_plus', 'w', 'w_plus',
@@ -169,17 +222,24 @@ EncodingErrorHandlingMode: TypeAlias = Annotated[Literal[
 class CSVReader(Iterator[List[str]]):
     line_num: int
     @property
-    def dialect(self) -> csv.Dialect: ...
+    def dialect(self) -> 'csv.Dialect': ...
     def __next__(self) -> List[str]: ...
 
 
 class CSVWriter:
     @property
-    def dialect(self) -> csv.Dialect: ...
+    def dialect(self) -> 'csv.Dialect': ...
     def writerow(self, row: Iterable[Any]) -> Any: ...
     def writerows(self, rows: Iterable[Iterable[Any]]) -> None: ...
 
 
+class WalkArrays(NamedTuple):
+    paths:    List[PathLink]
+    st_mode:  'array[int]'
+    st_size:  'array[int]'
+    st_mtime: 'array[float]'
+
+
 UNIQUE: Final[Annotated[object, 'A unique object.']] = object()
 
 sepb: Final[Annotated[bytes, 'The byte type path separator.']] = sep.encode()
@@ -259,6 +319,8 @@ class ReadOnly(metaclass=ReadOnlyMode):
     __module__ = builtins.__name__
     __qualname__ = object.__name__
 
+    __slots__ = ()
+
     # __dict__ = {}
     # Tamper with attribute `__dict__` to avoid modifying its subclass instance
     # attribute externally, but the serious problem is that it cannot
@@ -266,13 +328,33 @@ class ReadOnly(metaclass=ReadOnlyMode):
     # moment, the solution is still in the works.
 
     def __setattr__(self, name: str, value: Any) -> None:
-        if sys._getframe(1).f_globals['__name__'] != __name__ and not \
-                (isinstance(self, File) and name in ('content', 'contents')):
+        # This module sets the attributes with `setattribute`, which bypasses
+        # this method, rather than looking up the caller's frame on each set.
+        if not (isinstance(self, File) and name in ('content', 'contents')):
             raise ex.SetAttributeError(
                 f'cannot set "{name}" attribute in instance '
                 f'of immutable type "{self.__class__.__name__}".'
             )
-        object.__setattr__(self, name, value)
+        setattribute(self, name, value)
+
+    def __getstate__(self) -> Tuple[None, dict]:
+        # Pickle protocols 0 and 1 refuse the slots without it, the state is the
+        # one protocol 2 makes (the set slots, by their mangled names).
+        state: dict = {}
+        for cls in self.__class__.__mro__:
+            for name, member in vars(cls).items():
+                if member.__class__ is MemberDescriptorType:
+                    try:
+                        state[name] = member.__get__(self)
+                    except AttributeError:
+                        pass
+        return None, state
+
+    def __setstate__(self, state: Tuple[Optional[dict], dict]) -> None:
+        # Without `__dict__` the slots are restored by `setattr`, which is
+        # disallowed.
+        for name, value in state[1].items():
+            setattribute(self, name, value)
 
     def __delattr__(self, name: str) -> None:
         if not isinstance(self, File) or name != 'content':
@@ -286,35 +368,28 @@ class ReadOnly(metaclass=ReadOnlyMode):
 ReadOnly.__name__ = object.__name__
 builtins.ReadOnly = ReadOnly
 
+# Set an attribute of a `ReadOnly` instance from within this module.
+setattribute: Final[Callable[[Any, str, Any], None]] = object.__setattr__
 
-def dst2abs(func: Callable) -> Closure:
+
+def dst2abs(path: PathType, dst: PathLink, /) -> PathLink:
     # If the destination path is relative and is a single name, the parent path
     # of the source is used as the parent path of the destination instead of
     # using the current working directory, different from the traditional way.
-    @functools.wraps(func)
-    def core(path: PathType, dst: PathLink) -> PathLink:
-        try:
-            singlename: bool = basename(dst) == dst
-        except TypeError:
-            raise ex.DestinationPathTypeError(
-                'destination path type can only be "bytes" or "str", '
-                f'not "{dst.__class__.__name__}".'
-            ) from None
-        if singlename:
-            try:
-                dst: PathLink = join(dirname(path), dst)
-            except TypeError as e:
-                if dst.__class__ is bytes:
-                    name: bytes = path.name.encode()
-                elif dst.__class__ is str:
-                    name: str = path.name.decode()
-                else:
-                    raise e from None
-                dst: PathLink = join(dirname(name), dst)
-        func(path, dst)
-        path.name = dst
+    try:
+        singlename: bool = basename(dst) == dst
+    except TypeError:
+        raise ex.DestinationPathTypeError(
+            'destination path type can only be "bytes" or "str", '
+            f'not "{dst.__class__.__name__}".'
+        ) from None
+    if not singlename:
         return dst
-    return core
+    name: PathLink = path.name
+    if name.__class__ is not dst.__class__:
+        name: PathLink = name.encode() if dst.__class__ is bytes \
+            else name.decode()
+    return join(dirname(name), dst)
 
 
 def joinpath(func: Callable) -> Closure:
@@ -346,9 +421,11 @@ def ignore_error(e) -> bool:
     )
 
 
-def testpath(testfunc: Callable[[int], bool], path: PathType) -> bool:
+def testpath(
+        testfunc: Callable[[int], bool], path: PathType, /, *, lstat=False
+) -> bool:
     try:
-        return testfunc(path.stat.st_mode)
+        return testfunc((path.lstat if lstat else path.stat).st_mode)
     except OSError as e:
         # Path does not exist or is a broken symlink.
         if not ignore_error(e):
@@ -359,7 +436,335 @@ def testpath(testfunc: Callable[[int], bool], path: PathType) -> bool:
         return False
 
 
+def hassize(st: stat_result, /) -> bool:
+    # Whether `st_size` is the length of the content. Pseudo files (in "/proc"
+    # and "/sys") are regular files too, but report a size of 0 or of a page and
+    # allocate no blocks.
+    return s_isreg(st.st_mode) and getattr(st, 'st_blocks', 1) > 0
+
+
+def scandirs(dirpath: PathLink, /) -> List[DirEntry]:
+    # Read the whole directory up front so that the descriptor is released
+    # before recursing, the entries keep the file type reported by the system.
+    with scandir(dirpath) as entries:
+        return list(entries)
+
+
+def isdir_entry(entry: DirEntry, /) -> bool:
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
+
+
+def isfile_entry(entry: DirEntry, /) -> bool:
+    try:
+        return entry.is_file()
+    except OSError:
+        return False
+
+
+def fnmatcher(
+        patterns: Optional[NamePatterns],
+        pathtype: type,
+        /
+) -> Optional[Callable]:
+    # Combine shell-style patterns into one compiled regular expression, so that
+    # each name is matched once instead of once per pattern.
+    if patterns is None:
+        return None
+    if patterns.__class__ in (bytes, str):
+        patterns = patterns,
+    import re
+    from fnmatch import translate
+    regex: str = '|'.join(translate(fsdecode(x)) for x in patterns) or '(?!)'
+    return re.compile(
+        fsencode(regex) if pathtype is bytes else regex,
+        re.IGNORECASE if sys.platform == 'win32' else 0
+    ).match
+
+
+class ExistsCache(dict):
+    # Short-lived results of the existence probes (`exists`, `lexists`,
+    # `isdir`, `isfile`), disabled until `Path.enable_exists_cache` is called.
+    # Every mutating method of this module drops all entries.
+    ttl:     Optional[float] = None
+    maxsize: int             = 4096
+    lock:    Lock            = Lock()
+
+
+exists_cache = ExistsCache()
+
+
+def existscache(func: Callable[[PathType], bool]) -> Closure:
+    @functools.wraps(func)
+    def core(path: PathType) -> bool:
+        if exists_cache.ttl is None:
+            return func(path)
+        key = func.__name__, path.name, path.dir_fd, path.follow_symlinks
+        now: float = monotonic()
+        try:
+            r, deadline = exists_cache[key]
+        except KeyError:
+            pass
+        else:
+            if now < deadline:
+                return r
+        r: bool = func(path)
+        with exists_cache.lock:
+            exists_cache.pop(key, None)
+            if len(exists_cache) >= exists_cache.maxsize:
+                del exists_cache[next(iter(exists_cache))]
+            exists_cache[key] = r, now + exists_cache.ttl
+        return r
+    return core
+
+
+class Buffers(local):
+    # One reusable buffer per thread for the read/write loops, so that copying
+    # or hashing many small files does not allocate a new buffer per file.
+    buffer = bytearray()
+
+    def get(self, size: int, /) -> memoryview:
+        if len(self.buffer) < size:
+            self.buffer = bytearray(size)
+        return memoryview(self.buffer)[:size]
+
+
+buffers = Buffers()
+
+
+def sequential(fd: int, /) -> None:
+    # Tell the kernel that the file will be read from start to end, so that it
+    # reads ahead more aggressively (twice the default window on Linux).
+    if posix_fadvise is not None:
+        try:
+            posix_fadvise(fd, 0, 0, POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass  # e.g. ESPIPE, not a regular file.
+
+
+def filechanged(file: Union['File', PathLink], /) -> None:
+    # The content of the file has been written (its size and times in a cached
+    # status are stale), or the file may have been created.
+    if isinstance(file, File):
+        file.clear_cache()
+    else:
+        exists_cache.clear()
+
+
+def copyfd(infd: int, outfd: int, length: int = -1, /) -> int:
+    # Copy data between two file descriptors starting from their current
+    # offsets, in kernel space where the platform allows, so that the data does
+    # not travel through user space. Try in turn `copy_file_range` (in-kernel,
+    # may reflink on Btrfs/XFS), `sendfile` (Linux only) and a plain
+    # read/write loop; the next is only tried if the previous failed or copied
+    # nothing. Copy until EOF if `length` is negative.
+    copied, remaining = 0, length if length >= 0 else 1 << 62
+    sequential(infd)
+
+    for kcopy in (copy_file_range, sendfile):
+        if kcopy is None:
+            continue
+        try:
+            while remaining:
+                n: int = kcopy(infd, outfd, min(remaining, 1 << 30)) \
+                    if kcopy is copy_file_range else \
+                    kcopy(outfd, infd, None, min(remaining, 1 << 30))
+                if not n:
+                    break
+                copied    += n
+                remaining -= n
+        except OSError as e:
+            if copied or e.errno not in (
+                    EXDEV, EINVAL, ENOSYS, EBADF, ETXTBSY, EOPNOTSUPP
+            ):
+                raise
+            continue
+        # Nothing copied may not be the end of the file: `copy_file_range`
+        # copies nothing from the files of /proc and /sys on Linux 5.3 to 5.18
+        # (as `shutil` notes), so the next way is tried.
+        if copied or not remaining:
+            return copied
+
+    buffer: memoryview = buffers.get(min(COPY_BUFSIZE, remaining))
+    with FileIO(infd, closefd=False) as fsrc:
+        readinto = fsrc.readinto
+        while remaining:
+            n: int = readinto(buffer[:min(COPY_BUFSIZE, remaining)])
+            if not n:
+                break
+            written = 0
+            while written < n:
+                written += oswrite(outfd, buffer[written:n])
+            copied    += n
+            remaining -= n
+
+    return copied
+
+
+def extindex(path: PathLink, /) -> int:
+    # The index where the extension of `path` starts (`len(path)` if it has
+    # none), same as `os.path.splitext` but without its per-call dispatch and
+    # tuple. Leading dots of the base name (e.g. ".bashrc") are not a suffix.
+    if path.__class__ is bytes:
+        i: int = path.rfind(sepb) + 1
+        if sys.platform == 'win32':
+            i = max(i, path.rfind(b'/') + 1)
+        j, dot = path.rfind(b'.'), b'.'
+    else:
+        i: int = path.rfind(sep) + 1
+        if sys.platform == 'win32':
+            i = max(i, path.rfind('/') + 1)
+        j, dot = path.rfind('.'), '.'
+    return j if j > i and path[i:j].lstrip(dot) else len(path)
+
+
+def writeall(fd: int, buffers: Sequence[bytes], /) -> int:
+    # Write the buffers in order with as few system calls as possible, `writev`
+    # writes them all at once where available (up to `IOV_MAX`, 1024 on most
+    # platforms).
+    total: int = sum(len(x) for x in buffers)
+    written: int = writev(fd, buffers) \
+        if writev is not None and 1 < len(buffers) <= 1024 else 0
+    if written < total:
+        data = memoryview(b''.join(buffers))
+        while written < total:
+            written += oswrite(fd, data[written:])
+    return total
+
+
+def copyregular(src: PathLink, dst: PathLink, /) -> None:
+    # Copy the data of the regular file `src` through `copyfd`, so that
+    # `copy_file_range` can share the extents on copy-on-write file systems
+    # (Btrfs, XFS) instead of copying them.
+    with FileIO(src) as fsrc:
+        x: stat_result = fstat(fsrc.fileno())
+        # Opening an existing FIFO for writing would block, refuse it as
+        # `shutil.copyfile` does.
+        try:
+            if s_isfifo(stat(dst).st_mode):
+                raise SpecialFileError(f'`{dst}` is a named pipe')
+        except FileNotFoundError:
+            pass
+        outfd: int = osopen(dst, O_WRONLY | O_CREAT | O_BINARY, 0o666)
+        try:
+            y: stat_result = fstat(outfd)
+            if (x.st_dev, x.st_ino) == (y.st_dev, y.st_ino):
+                raise SameFileError(f'{src!r} and {dst!r} are the same file')
+            ftruncate(outfd, 0)
+            copyfd(fsrc.fileno(), outfd)
+        finally:
+            osclose(outfd)
+
+
+def fastcopyfile(
+        src: PathLink, dst: PathLink, *, follow_symlinks: bool = True
+) -> PathLink:
+    # Same as `shutil.copyfile`, but the data goes through `copyregular`. Where
+    # `copy_file_range` is missing, `shutil.copyfile` already uses the best
+    # native call of the platform (`sendfile`, `fcopyfile`). Symlinks that are
+    # not followed and special files (which must not be opened, a FIFO would
+    # block) are left to `shutil`.
+    if copy_file_range is None or not s_isreg(
+            (stat if follow_symlinks else lstat)(src).st_mode
+    ):
+        return copyfile(src, dst, follow_symlinks=follow_symlinks)
+    copyregular(src, dst)
+    return dst
+
+
+def fastcopy2(
+        src: PathLink, dst: PathLink, *, follow_symlinks: bool = True
+) -> PathLink:
+    # Same as `shutil.copy2`, but the data goes through `copyregular` (see
+    # `fastcopyfile`).
+    if copy_file_range is None or not s_isreg(
+            (stat if follow_symlinks else lstat)(src).st_mode
+    ):
+        return copy2(src, dst, follow_symlinks=follow_symlinks)
+
+    if isdir(dst):
+        dst: PathLink = join(dst, basename(src))
+
+    copyregular(src, dst)
+    copystat(src, dst, follow_symlinks=follow_symlinks)
+    return dst
+
+
+if sys.platform == 'linux':
+    # <linux/fs.h>, the request is declared with `long` (its size is encoded
+    # in the request, `_IOR`/`_IOW('f', 1/2, long)`) but the kernel reads and
+    # writes an `int`.
+    from struct import calcsize
+    FS_IOC_GETFLAGS: Final[int] = 0x80006601 | calcsize('l') << 16
+    FS_IOC_SETFLAGS: Final[int] = 0x40006602 | calcsize('l') << 16
+    del calcsize
+
+    # In the order that `lsattr` prints them.
+    FS_FLAGS: Final[Dict[str, int]] = {
+        's': 0x00000001, 'u': 0x00000002, 'S': 0x00000008, 'D': 0x00010000,
+        'i': 0x00000010, 'a': 0x00000020, 'd': 0x00000040, 'A': 0x00000080,
+        'c': 0x00000004, 'E': 0x00000800, 'j': 0x00004000, 'I': 0x00001000,
+        't': 0x00008000, 'T': 0x00020000, 'e': 0x00080000, 'C': 0x00800000,
+        'x': 0x02000000, 'F': 0x40000000, 'N': 0x10000000, 'P': 0x20000000,
+        'V': 0x00100000, 'm': 0x00000400
+    }
+
+    # Listed by `lsattr` but cannot be changed by `chattr`, kept as is by "=",
+    # together with the flags `lsattr` does not list. The "e" flag cannot be
+    # removed on most file systems either.
+    FS_FLAGS_READONLY: Final[str] = 'EINV'
+    FS_FLAGS_KEEP: Final[int] = ~functools.reduce(int.__or__, (
+        v for k, v in FS_FLAGS.items() if k not in FS_FLAGS_READONLY + 'e'
+    )) & 0xffffffff
+
+    def fsflags(
+            path: PathLink,
+            update: Optional[Callable[[int], int]] = None,
+            /, *,
+            dir_fd: Optional[int] = None
+    ) -> int:
+        # Get (and update) the inode flags through `ioctl`, as `lsattr` and
+        # `chattr` do, without starting a process.
+        fd: int = osopen(
+            path, O_RDONLY | O_NONBLOCK | O_CLOEXEC, dir_fd=dir_fd
+        )
+        try:
+            flags: int = int.from_bytes(
+                ioctl(fd, FS_IOC_GETFLAGS, bytes(4)), sys.byteorder
+            )
+            if update is not None:
+                flags: int = update(flags)
+                ioctl(fd, FS_IOC_SETFLAGS, flags.to_bytes(4, sys.byteorder))
+            return flags
+        finally:
+            osclose(fd)
+
+if sys.platform != 'win32':
+    def sudo(command: str, *args: PathLink) -> Optional[str]:
+        # Run the system command with `sudo` (not needed by root), without a
+        # shell and without prompting for a password, the last argument is the
+        # path. Returns its output, or None if it failed.
+        import subprocess
+        argv = (command, *args[:-1], '--', args[-1])
+        if geteuid() != 0:
+            argv = ('sudo', '-n', *argv)
+        try:
+            p = subprocess.run(
+                argv, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+            )
+        except OSError:
+            return None
+        return p.stdout.decode(errors='replace') if p.returncode == 0 else None
+
+
 class Path(ReadOnly):
+    # No `__dict__`, a walk over a large tree creates a lot of instances.
+    __slots__ = (
+        'name', 'strict', 'dir_fd', 'follow_symlinks', 'cache_stat',
+        '__stat', '__lstat'
+    )
 
     def __new__(cls, name: PathLink = UNIQUE, /, *, strict: bool = False, **kw):
         # Compatible object deserialization.
@@ -382,12 +787,16 @@ class Path(ReadOnly):
             autoabs:         bool          = False,
             strict:          bool          = False,
             dir_fd:          Optional[int] = None,
-            follow_symlinks: bool          = True
+            follow_symlinks: bool          = True,
+            cache_stat:      bool          = False
     ):
-        self.name            = abspath(name) if autoabs else name
-        self.strict          = strict
-        self.dir_fd          = dir_fd
-        self.follow_symlinks = follow_symlinks
+        setattribute(self, 'name', abspath(name) if autoabs else name)
+        setattribute(self, 'strict', strict)
+        setattribute(self, 'dir_fd', dir_fd)
+        setattribute(self, 'follow_symlinks', follow_symlinks)
+        setattribute(self, 'cache_stat', cache_stat)
+        setattribute(self, '_Path__stat', None)
+        setattribute(self, '_Path__lstat', None)
 
     def __str__(self) -> str:
         return self.name if self.name.__class__ is str else repr(self.name)
@@ -421,7 +830,7 @@ class Path(ReadOnly):
             self.__class__ == other_type,
             self.__class__ in (Path, SystemPath),
             other_type     in (Path, SystemPath)
-        )) and abspath(self) == other_path and self.dir_fd == other_dir_fd
+        )) and abspath(self.name) == other_path and self.dir_fd == other_dir_fd
 
     def __len__(self) -> int:
         return len(self.name)
@@ -436,7 +845,7 @@ class Path(ReadOnly):
         if isinstance(subpath, Path):
             subpath: PathLink = subpath.name
         try:
-            joined_path: PathLink = join(self, subpath)
+            joined_path: PathLink = join(self.name, subpath)
         except TypeError:
             if subpath.__class__ is bytes:
                 subpath: str = subpath.decode()
@@ -448,7 +857,7 @@ class Path(ReadOnly):
                     f'"{__package__}.{Path.__name__}" or a path link, '
                     f'not "{subpath.__class__.__name__}".'
                 ) from None
-            joined_path: PathLink = join(self, subpath)
+            joined_path: PathLink = join(self.name, subpath)
 
         if self.strict:
             if isfile(joined_path):
@@ -468,7 +877,8 @@ class Path(ReadOnly):
             joined_path,
             strict=self.strict,
             dir_fd=self.dir_fd,
-            follow_symlinks=self.follow_symlinks
+            follow_symlinks=self.follow_symlinks,
+            cache_stat=self.cache_stat
         )
 
     def __add__(self, subpath: Union[PathType, PathLink], /) -> PathType:
@@ -491,95 +901,129 @@ class Path(ReadOnly):
         return self.__class__(
             joined_path,
             strict=self.strict,
-            follow_symlinks=self.follow_symlinks
+            follow_symlinks=self.follow_symlinks,
+            cache_stat=self.cache_stat
         )
 
     def __radd__(self, dirpath: PathLink, /) -> PathType:
         return self.__rtruediv__(dirpath)
 
-    @property
-    def basename(self) -> BytesOrStr:
-        return basename(self)
+    if sys.platform == 'win32':
+        @property
+        def basename(self) -> BytesOrStr:
+            return basename(self.name)
+    else:
+        @property
+        def basename(self) -> BytesOrStr:
+            # Same as `posixpath.basename`, without its per-call dispatch.
+            name: PathLink = self.name
+            sepx: BytesOrStr = sepb if name.__class__ is bytes else sep
+            return name[name.rfind(sepx) + 1:]
 
     @property
     def dirname(self) -> 'Directory':
         return Directory(
-            dirname(self),
+            dirname(self.name),
             strict=self.strict,
             dir_fd=self.dir_fd,
-            follow_symlinks=self.follow_symlinks
+            follow_symlinks=self.follow_symlinks,
+            cache_stat=self.cache_stat
         )
 
     def dirnamel(self, level: int) -> 'Directory':
-        directory = self
-        for _ in range(level):
-            directory: PathLink = dirname(directory)
+        if sys.platform == 'win32':
+            directory: PathLink = self.name
+            for _ in range(level):
+                directory: PathLink = dirname(directory)
+        else:
+            # Same as calling `posixpath.dirname` `level` times, but moves an
+            # end index instead of creating the intermediate strings.
+            name: PathLink = self.name
+            sepx: BytesOrStr = sepb if name.__class__ is bytes else sep
+            end: int = len(name)
+            for _ in range(level):
+                end = i = name.rfind(sepx, 0, end) + 1
+                while end and name.endswith(sepx, 0, end):
+                    end -= 1
+                if not end:
+                    # The head consists of separators only (the root).
+                    end = i
+            directory: PathLink = name[:end]
         return Directory(
             directory,
             strict=self.strict,
             dir_fd=self.dir_fd,
-            follow_symlinks=self.follow_symlinks
+            follow_symlinks=self.follow_symlinks,
+            cache_stat=self.cache_stat
         )
 
     def ldirname(self, *, level: int = 1) -> PathType:
-        sepx: BytesOrStr = sepb if self.name.__class__ is bytes else sep
-        return Directory(sepx.join(self.name.split(sepx)[level:]))
+        name: PathLink = self.name
+        sepx: BytesOrStr = sepb if name.__class__ is bytes else sep
+        return Directory(sepx.join(name.split(sepx)[level:]))
 
     @property
     def abspath(self) -> PathType:
         return self.__class__(
-            abspath(self),
+            abspath(self.name),
             strict=self.strict,
-            follow_symlinks=self.follow_symlinks
+            follow_symlinks=self.follow_symlinks,
+            cache_stat=self.cache_stat
         )
 
     def realpath(self, *, strict: bool = False) -> PathType:
         return self.__class__(
-            realpath(self, strict=strict),
+            realpath(self.name, strict=strict),
             strict=self.strict,
-            follow_symlinks=self.follow_symlinks
+            follow_symlinks=self.follow_symlinks,
+            cache_stat=self.cache_stat
         )
 
     def relpath(self, start: Optional[PathLink] = None) -> PathType:
         return self.__class__(
-            relpath(self, start=start),
+            relpath(self.name, start=start),
             strict=self.strict,
-            follow_symlinks=self.follow_symlinks
+            follow_symlinks=self.follow_symlinks,
+            cache_stat=self.cache_stat
         )
 
     def normpath(self) -> PathType:
         return self.__class__(
-            normpath(self),
+            normpath(self.name),
             strict=self.strict,
             dir_fd=self.dir_fd,
-            follow_symlinks=self.follow_symlinks
+            follow_symlinks=self.follow_symlinks,
+            cache_stat=self.cache_stat
         )
 
     def expanduser(self) -> PathType:
         return self.__class__(
-            expanduser(self),
+            expanduser(self.name),
             strict=self.strict,
-            follow_symlinks=self.follow_symlinks
+            follow_symlinks=self.follow_symlinks,
+            cache_stat=self.cache_stat
         )
 
     def expandvars(self) -> PathType:
         return self.__class__(
-            expandvars(self),
+            expandvars(self.name),
             strict=self.strict,
-            follow_symlinks=self.follow_symlinks
+            follow_symlinks=self.follow_symlinks,
+            cache_stat=self.cache_stat
         )
 
     def split(self) -> Tuple[PathLink, BytesOrStr]:
-        return split(self)
+        return split(self.name)
 
     def splitdrive(self) -> Tuple[BytesOrStr, PathLink]:
-        return splitdrive(self)
+        return splitdrive(self.name)
 
     @property
     def isabs(self) -> bool:
-        return isabs(self)
+        return isabs(self.name)
 
     @property
+    @existscache
     def exists(self) -> bool:
         try:
             self.stat
@@ -592,6 +1036,7 @@ class Path(ReadOnly):
         return True
 
     @property
+    @existscache
     def lexists(self) -> bool:
         try:
             self.lstat
@@ -604,16 +1049,18 @@ class Path(ReadOnly):
         return True
 
     @property
+    @existscache
     def isdir(self) -> bool:
         return testpath(s_isdir, self)
 
     @property
+    @existscache
     def isfile(self) -> bool:
         return testpath(s_isreg, self)
 
     @property
     def islink(self) -> bool:
-        return islink(self)
+        return testpath(s_islnk, self, lstat=True)
 
     @property
     def ismount(self) -> bool:
@@ -636,7 +1083,7 @@ class Path(ReadOnly):
         if self.isdir:
             return not bool(listdir(self))
         if self.isfile:
-            return not bool(getsize(self))
+            return not bool(self.stat.st_size)
         if self.exists:
             raise ex.NotADirectoryOrFileError(repr(self.name))
 
@@ -662,6 +1109,17 @@ class Path(ReadOnly):
             self, 1, dir_fd=self.dir_fd, follow_symlinks=self.follow_symlinks
         )
 
+    def permissions(self, *, effective_ids: bool = False) -> int:
+        kw = dict(
+            dir_fd=self.dir_fd,
+            effective_ids=effective_ids,
+            follow_symlinks=self.follow_symlinks
+        )
+        # Usually everything asked is granted, that takes a single call.
+        if access(self.name, 7, **kw):
+            return 7
+        return sum(mode for mode in (4, 2, 1) if access(self.name, mode, **kw))
+
     def delete(
             self,
             *,
@@ -676,26 +1134,52 @@ class Path(ReadOnly):
             except FileNotFoundError:
                 if not ignore_errors:
                     raise
+        self.clear_cache()
 
-    @dst2abs
-    def rename(self, dst: PathLink, /) -> None:
+    def rename(self, dst: PathLink, /) -> PathLink:
+        dst: PathLink = dst2abs(self, dst)
         rename(self, dst, src_dir_fd=self.dir_fd, dst_dir_fd=self.dir_fd)
+        setattribute(self, 'name', dst)
+        self.clear_cache()
+        return dst
 
-    @dst2abs
-    def renames(self, dst: PathLink, /) -> None:
+    def renames(self, dst: PathLink, /) -> PathLink:
+        dst: PathLink = dst2abs(self, dst)
         renames(self, dst)
+        setattribute(self, 'name', dst)
+        self.clear_cache()
+        return dst
 
-    @dst2abs
-    def replace(self, dst: PathLink, /) -> None:
+    def replace(self, dst: PathLink, /) -> PathLink:
+        dst: PathLink = dst2abs(self, dst)
         replace(self, dst, src_dir_fd=self.dir_fd, dst_dir_fd=self.dir_fd)
+        setattribute(self, 'name', dst)
+        self.clear_cache()
+        return dst
 
     def move(
             self,
             dst: Union[PathType, PathLink],
             /, *,
-            copy_function: Callable[[PathLink, PathLink], None] = copy2
+            copy_function: Callable[[PathLink, PathLink], None] = fastcopy2
     ) -> None:
-        move(self, dst, copy_function=copy_function)
+        # Moving a file is usually a single rename (`replace`, which overwrites
+        # an existing file on Windows too, as `shutil.move` ends up doing), only
+        # across file systems `shutil.move` copies it. Into a directory (or a
+        # symlink to one) and directories always go to `shutil.move`, renaming
+        # onto it would replace it instead of moving into it.
+        try:
+            if self.isdir or isdir(dst):
+                move(self, dst, copy_function=copy_function)
+            else:
+                try:
+                    replace(self.name, dst)
+                except OSError as e:
+                    if e.errno != EXDEV:
+                        raise
+                    move(self, dst, copy_function=copy_function)
+        finally:
+            self.clear_cache()
 
     def copystat(self, dst: Union[PathType, PathLink], /) -> None:
         copystat(self, dst, follow_symlinks=self.follow_symlinks)
@@ -705,36 +1189,99 @@ class Path(ReadOnly):
 
     def symlink(self, dst: Union[PathType, PathLink], /) -> None:
         symlink(self, dst, dir_fd=self.dir_fd)
+        exists_cache.clear()
 
     def readlink(self) -> PathLink:
         return readlink(self, dir_fd=self.dir_fd)
 
     @property
     def stat(self) -> stat_result:
-        return stat(
-            self, dir_fd=self.dir_fd, follow_symlinks=self.follow_symlinks
+        if self.__stat is not None:
+            return self.__stat
+        st: stat_result = stat(
+            self.name, dir_fd=self.dir_fd, follow_symlinks=self.follow_symlinks
         )
+        if self.cache_stat:
+            setattribute(self, '_Path__stat', st)
+            if not self.follow_symlinks:
+                setattribute(self, '_Path__lstat', st)
+        return st
 
     @property
     def lstat(self) -> stat_result:
-        return lstat(self, dir_fd=self.dir_fd)
+        if self.__lstat is not None:
+            return self.__lstat
+        st: stat_result = lstat(self.name, dir_fd=self.dir_fd)
+        if self.cache_stat:
+            setattribute(self, '_Path__lstat', st)
+            # Not a symlink, following it would stat the same inode.
+            if not s_islnk(st.st_mode):
+                setattribute(self, '_Path__stat', st)
+        return st
+
+    def clear_cache(self) -> None:
+        setattribute(self, '_Path__stat', None)
+        setattribute(self, '_Path__lstat', None)
+        exists_cache.clear()
+
+    @staticmethod
+    def stat_many(
+            paths:           Iterable[Union[PathType, PathLink]],
+            /, *,
+            follow_symlinks: bool = True,
+            workers:         int  = 16
+    ) -> List[Optional[stat_result]]:
+        def stat1(path: Union[PathType, PathLink]) -> Optional[stat_result]:
+            try:
+                return stat(path, follow_symlinks=follow_symlinks)
+            except OSError as e:
+                if not ignore_error(e):
+                    raise
+            except ValueError:
+                pass
+
+        paths = list(paths)
+        if workers <= 1 or len(paths) <= 1:
+            return [stat1(path) for path in paths]
+
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(min(workers, len(paths))) as pool:
+            return list(pool.map(stat1, paths))
+
+    @staticmethod
+    def enable_exists_cache(ttl: float = 1.0, *, maxsize: int = 4096) -> None:
+        if ttl <= 0 or maxsize <= 0:
+            raise ex.ParameterError(
+                'parameters "ttl" and "maxsize" must be greater than 0.'
+            )
+        with exists_cache.lock:
+            exists_cache.clear()
+            exists_cache.ttl     = ttl
+            exists_cache.maxsize = maxsize
+
+    @staticmethod
+    def disable_exists_cache() -> None:
+        with exists_cache.lock:
+            exists_cache.ttl = None
+            exists_cache.clear()
 
     def getsize(self) -> int:
-        return getsize(self)
+        return self.stat.st_size
 
     def getctime(self) -> float:
-        return getctime(self)
+        return self.stat.st_ctime
 
     def getmtime(self) -> float:
-        return getmtime(self)
+        return self.stat.st_mtime
 
     def getatime(self) -> float:
-        return getatime(self)
+        return self.stat.st_atime
 
     def chmod(self, mode: int, /) -> None:
         chmod(
             self, mode, dir_fd=self.dir_fd, follow_symlinks=self.follow_symlinks
         )
+        self.clear_cache()
 
     def access(self, mode: int, /, *, effective_ids: bool = False) -> bool:
         return access(
@@ -746,7 +1293,8 @@ class Path(ReadOnly):
 
     if sys.platform != 'win32':
         def lchmod(self, mode: int, /) -> None:
-            lchmod(self, mode)
+            chmod(self.name, mode, dir_fd=self.dir_fd, follow_symlinks=False)
+            self.clear_cache()
 
         @property
         def owner(self) -> str:
@@ -757,50 +1305,113 @@ class Path(ReadOnly):
             return getgrgid(self.stat.st_gid).gr_name
 
         def chown(self, uid: int, gid: int) -> None:
-            return chown(
+            chown(
                 self, uid, gid,
                 dir_fd=self.dir_fd,
                 follow_symlinks=self.follow_symlinks
             )
+            self.clear_cache()
 
         def lchown(self, uid: int, gid: int) -> None:
-            lchown(self, uid, gid)
+            chown(
+                self.name, uid, gid, dir_fd=self.dir_fd, follow_symlinks=False
+            )
+            self.clear_cache()
 
         def chflags(self, flags: int) -> None:
             chflags(self, flags, follow_symlinks=self.follow_symlinks)
 
         def lchflags(self, flags: int) -> None:
-            lchflags(self, flags)
+            chflags(self.name, flags, follow_symlinks=False)
 
-        def chattr(self, operator: Literal['+', '-', '='], attrs: str) -> None:
-            warnings.warn(
-                'implementation of method `chattr` is to directly call the '
-                'system command `chattr`, so this is very unreliable.'
-            , stacklevel=2)
-            if operator not in ('+', '-', '='):
-                raise ex.ChattrError(
-                    f'unsupported operation "{operator}", only "+", "-" or "=".'
-                )
-            pathlink: str = self.name if self.name.__class__ is str \
-                else self.name.decode()
-            c: str = f'chattr {operator}{attrs} {pathlink}'
-            if system(f'sudo {c} &>/dev/null'):
-                raise ex.ChattrError(c)
+        if sys.platform == 'linux':
+            def chattr(
+                    self, operator: Literal['+', '-', '='], attrs: str
+            ) -> None:
+                if operator not in ('+', '-', '='):
+                    raise ex.ChattrError(
+                        f'unsupported operation "{operator}", '
+                        'only "+", "-" or "=".'
+                    )
+                mask: int = 0
+                for attr in attrs:
+                    if attr not in FS_FLAGS or attr in FS_FLAGS_READONLY:
+                        raise ex.ChattrError(
+                            f'unsupported attribute "{attr}".'
+                        )
+                    mask |= FS_FLAGS[attr]
+
+                if operator == '+':
+                    def update(flags: int) -> int: return flags | mask
+                elif operator == '-':
+                    def update(flags: int) -> int: return flags & ~mask
+                else:
+                    def update(flags: int) -> int:
+                        return flags & FS_FLAGS_KEEP | mask
 
-        def lsattr(self) -> str:
-            warnings.warn(
-                'implementation of method `lsattr` is to directly call the '
-                'system command `lsattr`, so this is very unreliable.'
-            , stacklevel=2)
-            pathlink: str = self.name if self.name.__class__ is str \
-                else self.name.decode()
-            c: str = f'lsattr {pathlink}'
-            attrs: str = popen(
-                "sudo %s 2>/dev/null | awk '{print $1}'" % c
-            ).read()[:-1]
-            if len(attrs) != 16:
-                raise ex.LsattrError(c)
-            return attrs
+                try:
+                    fsflags(self.name, update, dir_fd=self.dir_fd)
+                except OSError as e:
+                    # Most of the flags (e.g. "i" and "a") need privileges,
+                    # leave them to the system command under `sudo`, as was
+                    # done before `ioctl` was used.
+                    if e.errno not in (EPERM, EACCES) \
+                            or self.dir_fd is not None \
+                            or sudo('chattr', operator + attrs, self.name) \
+                            is None:
+                        raise ex.ChattrError(
+                            f'chattr {operator}{attrs} {self.name!r}: '
+                            f'{e.strerror}.'
+                        ) from None
+
+            def lsattr(self) -> str:
+                try:
+                    flags: int = fsflags(self.name, dir_fd=self.dir_fd)
+                except OSError as e:
+                    output: Optional[str] = None
+                    if e.errno in (EPERM, EACCES) and self.dir_fd is None:
+                        output: Optional[str] = \
+                            sudo('lsattr', '-d', self.name)
+                    if not output:
+                        raise ex.LsattrError(
+                            f'lsattr {self.name!r}: {e.strerror}.'
+                        ) from None
+                    attrs: str = output.split(maxsplit=1)[0]
+                    return ''.join(
+                        k if k in attrs else '-' for k in FS_FLAGS
+                    )
+                return ''.join(
+                    k if flags & v else '-' for k, v in FS_FLAGS.items()
+                )
+        else:
+            def chattr(
+                    self, operator: Literal['+', '-', '='], attrs: str
+            ) -> None:
+                import warnings
+                warnings.warn(
+                    'implementation of method `chattr` is to directly call '
+                    'the system command `chattr`, so this is very unreliable.'
+                , stacklevel=2)
+                if operator not in ('+', '-', '='):
+                    raise ex.ChattrError(
+                        f'unsupported operation "{operator}", '
+                        'only "+", "-" or "=".'
+                    )
+                if sudo('chattr', operator + attrs, self.name) is None:
+                    raise ex.ChattrError(
+                        f'chattr {operator}{attrs} {self.name!r}.'
+                    )
+
+            def lsattr(self) -> str:
+                import warnings
+                warnings.warn(
+                    'implementation of method `lsattr` is to directly call '
+                    'the system command `lsattr`, so this is very unreliable.'
+                , stacklevel=2)
+                output: Optional[str] = sudo('lsattr', '-d', self.name)
+                if not output:
+                    raise ex.LsattrError(f'lsattr {self.name!r}.')
+                return output.split(maxsplit=1)[0]
 
         def exattr(self, attr: str, /) -> bool:
             return attr in self.lsattr()
@@ -839,9 +1450,11 @@ class Path(ReadOnly):
             dir_fd=self.dir_fd,
             follow_symlinks=self.follow_symlinks
         )
+        self.clear_cache()
 
 
 class Directory(Path):
+    __slots__ = ()
 
     def __new__(
             cls, name: PathLink = '.', /, *, strict: bool = False, **kw
@@ -874,10 +1487,25 @@ class Directory(Path):
         Path(path).delete()
 
     def __iter__(self) -> Iterator[Union['Directory', 'File', Path]]:
-        for name in listdir(self):
-            path: PathLink = join(self, name)
-            yield Directory(path) if isdir(path) else \
-                File(path) if isfile(path) else Path(path)
+        cache_stat: bool = self.cache_stat
+        for entry in scandirs(self.name):
+            path: PathType = (
+                Directory if isdir_entry(entry) else
+                File if isfile_entry(entry) else Path
+            )(entry.path, cache_stat=cache_stat)
+            if cache_stat:
+                # Seed the cache with the status `scandir` got (free on
+                # Windows, one `lstat` elsewhere), a symlink still needs its
+                # own `stat`.
+                try:
+                    st: stat_result = entry.stat(follow_symlinks=False)
+                except OSError:
+                    pass
+                else:
+                    setattribute(path, '_Path__lstat', st)
+                    if not s_islnk(st.st_mode):
+                        setattribute(path, '_Path__stat', st)
+            yield path
 
     def __bool__(self) -> bool:
         return self.isdir
@@ -904,13 +1532,15 @@ class Directory(Path):
     def tree(
             self,
             *,
-            level:      int            = float('inf'),
-            downtop:    Optional[bool] = None,
-            bottom_up:  bool           = UNIQUE,
-            omit_dir:   bool           = False,
-            pure_path:  Optional[bool] = None,
-            mysophobia: bool           = UNIQUE,
-            shortpath:  bool           = False
+            level:      int                    = float('inf'),
+            downtop:    Optional[bool]         = None,
+            bottom_up:  bool                   = UNIQUE,
+            omit_dir:   bool                   = False,
+            pure_path:  Optional[bool]         = None,
+            mysophobia: bool                   = UNIQUE,
+            shortpath:  bool                   = False,
+            include:    Optional[NamePatterns] = None,
+            exclude:    Optional[NamePatterns] = None
     ) -> Iterator[Union[Path, PathLink]]:
         return tree(
             self.name,
@@ -920,7 +1550,9 @@ class Directory(Path):
             omit_dir  =omit_dir,
             pure_path =pure_path,
             mysophobia=mysophobia,
-            shortpath =shortpath
+            shortpath =shortpath,
+            include   =include,
+            exclude   =exclude
         )
 
     def walk(
@@ -933,6 +1565,33 @@ class Directory(Path):
             followlinks=not self.follow_symlinks
         )
 
+    def walk_arrays(self, *, level: int = float('inf')) -> WalkArrays:
+        from array import array
+        paths: List[PathLink] = []
+        st_mode, st_size, st_mtime = array('L'), array('q'), array('d')
+
+        stack: List[Tuple[PathLink, int]] = [(self.name, level)]
+        while stack:
+            dirpath, level = stack.pop()
+            try:
+                entries: List[DirEntry] = scandirs(dirpath)
+            except OSError:
+                continue
+            for entry in entries:
+                try:
+                    st: stat_result = \
+                        entry.stat(follow_symlinks=self.follow_symlinks)
+                except OSError:
+                    continue
+                paths.append(entry.path)
+                st_mode.append(st.st_mode)
+                st_size.append(st.st_size)
+                st_mtime.append(st.st_mtime)
+                if level > 1 and isdir_entry(entry) and not entry.is_symlink():
+                    stack.append((entry.path, level - 1))
+
+        return WalkArrays(paths, st_mode, st_size, st_mtime)
+
     def search(
             self,
             slicing:   BytesOrStr,
@@ -973,35 +1632,176 @@ class Directory(Path):
             /, *,
             symlinks:                 bool                         = False,
             ignore:                   Optional[CopyTreeIgnore]     = None,
-            copy_function:            CopyFunction                 = copy2,
+            ignore_entries:           Optional[DirEntryIgnore]     = None,
+            copy_function:            CopyFunction                 = fastcopy2,
             ignore_dangling_symlinks: bool                         = False,
-            dirs_exist_ok:            bool                         = False
-    ) -> None:
-        copytree(
-            self, dst,
-            symlinks                =symlinks,
-            ignore                  =ignore,
-            copy_function           =copy_function,
-            ignore_dangling_symlinks=ignore_dangling_symlinks,
-            dirs_exist_ok           =dirs_exist_ok
-        )
+            dirs_exist_ok:            bool                         = False,
+            workers:                  int = min(32, (cpu_count() or 1) * 4)
+    ) -> Union['Directory', PathLink]:
+        if workers <= 1:
+            if ignore_entries is not None:
+                # `shutil.copytree` only passes the names, list the directory
+                # again (one `scandir`, no `stat` per name) to get the entries.
+                def ignore(
+                        src: PathLink, names: List[BytesOrStr], ignore=ignore
+                ) -> Set[BytesOrStr]:
+                    ignored = set(ignore_entries(src, scandirs(src)))
+                    if ignore is not None:
+                        ignored.update(ignore(src, names))
+                    return ignored
+            try:
+                copytree(
+                    self, dst,
+                    symlinks                =symlinks,
+                    ignore                  =ignore,
+                    copy_function           =copy_function,
+                    ignore_dangling_symlinks=ignore_dangling_symlinks,
+                    dirs_exist_ok           =dirs_exist_ok
+                )
+            finally:
+                exists_cache.clear()
+            return dst
+
+        # Walk the tree as `shutil.copytree` does, but hand the file copies to
+        # a thread pool and copy the metadata of the directories only once the
+        # copies are done (deepest first): a read-only directory would refuse
+        # the files still queued for it, and creating them would change its
+        # modification time again.
+        from concurrent.futures import ThreadPoolExecutor
+        tasks = {}
+        dirstats: List[Tuple[PathLink, PathLink]] = []
+        errors: List[Tuple[PathLink, PathLink, str]] = []
+
+        def copydir(src: PathLink, dst: PathLink) -> None:
+            entries: List[DirEntry] = scandirs(src)
+            ignored: Set[BytesOrStr] = set()
+            if ignore_entries is not None:
+                ignored.update(ignore_entries(src, entries))
+            if ignore is not None:
+                ignored.update(ignore(src, [entry.name for entry in entries]))
+            makedirs(dst, exist_ok=dirs_exist_ok)
+            for entry in entries:
+                if entry.name in ignored:
+                    continue
+                srcname: PathLink = join(src, entry.name)
+                dstname: PathLink = join(dst, entry.name)
+                try:
+                    is_symlink: bool = entry.is_symlink()
+                    if is_symlink and sys.platform == 'win32':
+                        # Directory junctions appear as symlinks, but are
+                        # recursed into.
+                        from stat import IO_REPARSE_TAG_MOUNT_POINT
+                        if entry.stat(follow_symlinks=False).st_reparse_tag \
+                                == IO_REPARSE_TAG_MOUNT_POINT:
+                            is_symlink = False
+                    if is_symlink:
+                        linkto: PathLink = readlink(srcname)
+                        if symlinks:
+                            symlink(linkto, dstname)
+                            copystat(srcname, dstname, follow_symlinks=False)
+                            continue
+                        if ignore_dangling_symlinks and not exists(linkto):
+                            continue
+                    if entry.is_dir():
+                        copydir(srcname, dstname)
+                    else:
+                        tasks[pool.submit(copy_function, srcname, dstname)] = \
+                            srcname, dstname
+                except ShutilError as e:
+                    errors.extend(e.args[0])
+                except OSError as e:
+                    errors.append((srcname, dstname, str(e)))
+            dirstats.append((src, dst))
+
+        try:
+            with ThreadPoolExecutor(workers) as pool:
+                copydir(self.name, fspath(dst))
+        finally:
+            exists_cache.clear()
+
+        for task, (srcfile, dstfile) in tasks.items():
+            e: Optional[BaseException] = task.exception()
+            if e is None:
+                continue
+            if isinstance(e, ShutilError):
+                errors.extend(e.args[0])
+            elif isinstance(e, OSError):
+                errors.append((srcfile, dstfile, str(e)))
+            else:
+                raise e
+
+        # A directory is listed after its subdirectories.
+        for srcdir, dstdir in dirstats:
+            try:
+                copystat(srcdir, dstdir)
+            except OSError as e:
+                # Copying file access times may fail on Windows.
+                if getattr(e, 'winerror', None) is None:
+                    errors.append((srcdir, dstdir, str(e)))
+
+        if errors:
+            raise ShutilError(errors)
+
+        return dst
 
     def clear(
             self,
             *,
-            ignore_errors: bool = False,
-            onerror: Optional[Callable] = None
+            ignore_errors: bool               = False,
+            onerror:       Optional[Callable] = None,
+            workers:       int                = 8
     ) -> None:
-        for name in listdir(self):
-            path: PathLink = join(self, name)
-            if isdir(path):
-                rmtree(path, ignore_errors=ignore_errors, onerror=onerror)
+        # The errors of listing the directory and unlinking the files are
+        # handled as `shutil.rmtree` handles them.
+        def handle_error(func: Callable, path: PathLink) -> None:
+            if ignore_errors:
+                return
+            if onerror is None:
+                raise
+            onerror(func, path, sys.exc_info())
+
+        # The type of an entry comes from `scandir` for free, and a symlink to a
+        # directory is removed as a link (`rmtree` refuses symlinks).
+        subdirs: List[PathLink] = []
+        files:   List[PathLink] = []
+        try:
+            entries: List[DirEntry] = scandirs(self.name)
+        except OSError:
+            handle_error(scandir, self.name)
+            return
+        for entry in entries:
+            (subdirs if entry.is_dir(follow_symlinks=False) else files).append(
+                entry.path
+            )
+
+        def rmtree1(path: PathLink) -> None:
+            rmtree(path, ignore_errors=ignore_errors, onerror=onerror)
+
+        def remove1(path: PathLink) -> None:
+            try:
+                remove(path)
+            except OSError:
+                handle_error(remove, path)
+
+        try:
+            if workers <= 1 or len(subdirs) <= 1:
+                for path in subdirs:
+                    rmtree1(path)
+                for path in files:
+                    remove1(path)
             else:
-                try:
-                    remove(self)
-                except FileNotFoundError:
-                    if not ignore_errors:
-                        raise
+                # Unlinking is bound by system calls rather than the GIL, so
+                # the subdirectories are removed concurrently, while the files
+                # are unlinked in the current thread.
+                from concurrent.futures import ThreadPoolExecutor
+                with ThreadPoolExecutor(min(workers, len(subdirs))) as pool:
+                    tasks = [pool.submit(rmtree1, path) for path in subdirs]
+                    for path in files:
+                        remove1(path)
+                    for task in tasks:
+                        task.result()
+        finally:
+            exists_cache.clear()
 
     def mkdir(self, mode: int = 0o777, *, ignore_exists: bool = False) -> None:
         try:
@@ -1009,23 +1809,36 @@ class Directory(Path):
         except FileExistsError:
             if not ignore_exists:
                 raise
+        exists_cache.clear()
 
     def makedirs(self, mode: int = 0o777, *, exist_ok: bool = False) -> None:
         makedirs(self, mode, exist_ok=exist_ok)
+        exists_cache.clear()
 
     def rmdir(self) -> None:
         rmdir(self)
+        self.clear_cache()
 
     def removedirs(self) -> None:
         removedirs(self)
+        self.clear_cache()
 
     def rmtree(
             self,
             *,
-            ignore_errors: bool = False,
-            onerror: Optional[Callable] = None
+            ignore_errors: bool               = False,
+            onerror:       Optional[Callable] = None,
+            workers:       int                = 8
     ) -> None:
+        # With an error handling, `shutil.rmtree` alone deletes the directory,
+        # so that each error is handled exactly once.
+        if workers > 1 and not ignore_errors and onerror is None \
+                and testpath(s_isdir, self, lstat=True):
+            self.clear(workers=workers)
+        # Remove what is left (nothing, unless an error was ignored), and let
+        # `shutil.rmtree` handle a missing directory or a symlink.
         rmtree(self, ignore_errors=ignore_errors, onerror=onerror)
+        self.clear_cache()
 
     @property
     def isempty(self) -> bool:
@@ -1033,9 +1846,12 @@ class Directory(Path):
 
     def chdir(self) -> None:
         chdir(self)
+        # The relative path links now refer to other paths.
+        exists_cache.clear()
 
 
 class File(Path):
+    __slots__ = ('__ext',)
 
     def __new__(cls, name: PathLink = UNIQUE, /, *, strict: bool = False, **kw):
         instance = Path.__new__(cls, name, strict=strict, **kw)
@@ -1083,7 +1899,8 @@ class File(Path):
 
     @property
     def content(self) -> bytes:
-        return FileIO(self).read()
+        with FileIO(self) as f:
+            return f.read()
 
     @content.setter
     def content(self, content: bytes, /) -> None:
@@ -1094,11 +1911,17 @@ class File(Path):
                 'content type to be written can only be "bytes", '
                 f'not "{content.__class__.__name__}".'
             )
-        FileIO(self, 'wb').write(content)
+        fd: int = osopen(self, O_WRONLY | O_CREAT | O_TRUNC | O_BINARY, 0o666)
+        try:
+            writeall(fd, (content,))
+        finally:
+            osclose(fd)
+        self.clear_cache()
 
     @content.deleter
     def content(self) -> None:
         truncate(self, 0)
+        self.clear_cache()
 
     @property
     def contents(self) -> 'Content':
@@ -1109,32 +1932,61 @@ class File(Path):
         # For compatible with `Content.__iadd__` and `Content.__ior__`.
         pass
 
+    def __extindex(self) -> Tuple[PathLink, int]:
+        # `splitext` and `extension` are often used together, remember the
+        # extension index of the name it was computed for; a renamed instance
+        # has a new name object, which invalidates it.
+        name: PathLink = self.name
+        try:
+            ext: Tuple[PathLink, int] = self.__ext
+        except AttributeError:
+            pass
+        else:
+            if ext[0] is name:
+                return ext
+        ext: Tuple[PathLink, int] = name, extindex(name)
+        setattribute(self, '_File__ext', ext)
+        return ext
+
     def splitext(self) -> Tuple[BytesOrStr, BytesOrStr]:
-        return splitext(self)
+        name, i = self.__extindex()
+        return name[:i], name[i:]
 
     @property
     def extension(self) -> BytesOrStr:
-        return splitext(self)[1]
+        name, i = self.__extindex()
+        return name[i:]
 
     def copy(self, dst: Union[PathType, PathLink], /) -> None:
-        copyfile(self, dst, follow_symlinks=self.follow_symlinks)
+        fastcopyfile(self, dst, follow_symlinks=self.follow_symlinks)
+        filechanged(dst)
 
     def copycontent(
             self,
             other: Union['File', 'SupportsWrite[bytes]'],
             /, *,
-            bufsize: int = READ_BUFSIZE
+            bufsize: int = COPY_BUFSIZE
     ) -> Union['File', 'SupportsWrite[bytes]']:
-        write, read = (
-            FileIO(other, 'wb') if isinstance(other, File) else other
-        ).write, FileIO(self).read
-
-        while True:
-            content = read(bufsize)
-            if not content:
-                break
-            write(content)
-
+        with FileIO(self) as fsrc:
+            if isinstance(other, File):
+                # Opened without truncating, the source must not be emptied
+                # when it is the destination.
+                outfd: int = osopen(other, O_WRONLY | O_CREAT | O_BINARY, 0o666)
+                try:
+                    x, y = fstat(fsrc.fileno()), fstat(outfd)
+                    if (x.st_dev, x.st_ino) == (y.st_dev, y.st_ino):
+                        raise ex.IsSameFileError(
+                            'source and destination cannot be the same, '
+                            f'path "{abspath(self)}".'
+                        )
+                    ftruncate(outfd, 0)
+                    copyfd(fsrc.fileno(), outfd)
+                finally:
+                    osclose(outfd)
+                filechanged(other)
+            else:
+                sequential(fsrc.fileno())
+                copyfileobj(fsrc, other, bufsize)
         return other
 
     def link(self, dst: Union[PathType, PathLink], /) -> None:
@@ -1144,10 +1996,11 @@ class File(Path):
             dst_dir_fd=self.dir_fd,
             follow_symlinks=self.follow_symlinks
         )
+        exists_cache.clear()
 
     @property
     def isempty(self) -> bool:
-        return not bool(getsize(self))
+        return not bool(self.stat.st_size)
 
     if sys.platform == 'win32':
         def mknod(
@@ -1157,17 +2010,21 @@ class File(Path):
                 ignore_exists: bool = False,
                 **__
         ) -> None:
+            # The mode is applied on creation, no file object to leave open
+            # and no `chmod` afterwards.
             try:
-                FileIO(self, 'xb')
+                fd: int = \
+                    osopen(self, O_WRONLY | O_CREAT | O_EXCL | O_BINARY, mode)
             except FileExistsError:
                 if not ignore_exists:
                     raise
             else:
-                chmod(self, mode)
+                osclose(fd)
+                exists_cache.clear()
     else:
         def mknod(
                 self,
-                mode: int = None,
+                mode: int = 0o600,
                 *,
                 device: int = 0,
                 ignore_exists: bool = False
@@ -1177,18 +2034,27 @@ class File(Path):
             except FileExistsError:
                 if not ignore_exists:
                     raise
+            else:
+                exists_cache.clear()
 
     def mknods(
             self,
-            mode: int = 0o600 if sys.platform == 'win32' else None,
+            mode: int = 0o600,
             *,
             device: int = 0,
             ignore_exists: bool = False
     ) -> None:
-        parentdir: PathLink = dirname(self)
-        if not (parentdir in ('', b'') or exists(parentdir)):
-            makedirs(parentdir, mode, exist_ok=True)
-        self.mknod(mode, device=device, ignore_exists=ignore_exists)
+        # Usually the parent directory exists, try to create the file first
+        # rather than checking. The directories get the default mode, a file
+        # mode (without search permission) would make them unusable.
+        try:
+            self.mknod(mode, device=device, ignore_exists=ignore_exists)
+        except FileNotFoundError:
+            parentdir: PathLink = dirname(self)
+            if parentdir in ('', b''):
+                raise
+            makedirs(parentdir, exist_ok=True)
+            self.mknod(mode, device=device, ignore_exists=ignore_exists)
 
     def remove(self, *, ignore_errors: bool = False) -> None:
         try:
@@ -1196,22 +2062,32 @@ class File(Path):
         except FileNotFoundError:
             if not ignore_errors:
                 raise
+        self.clear_cache()
 
     def unlink(self) -> None:
         unlink(self, dir_fd=self.dir_fd)
+        self.clear_cache()
 
     def contains(self, subcontent: bytes, /) -> bool:
         return Content(self).contains(subcontent)
 
     def truncate(self, length: int) -> None:
         truncate(self, length)
+        self.clear_cache()
 
     def clear(self) -> None:
         truncate(self, 0)
+        self.clear_cache()
 
     def md5(self, salting: bytes = b'') -> str:
         return Content(self).md5(salting)
 
+    def blake3(self, salting: bytes = b'') -> str:
+        return Content(self).blake3(salting)
+
+    def murmur3(self, seed: int = 0) -> str:
+        return Content(self).murmur3(seed)
+
     def read(
             self, size: int = -1, /, *, encoding: Optional[str] = None, **kw
     ) -> str:
@@ -1232,6 +2108,8 @@ class File(Path):
 
 
 class Open(ReadOnly):
+    __slots__ = ('file',)
+
     __modes__ = {
         'r': BufferedReader,
         'w': BufferedWriter,
@@ -1247,28 +2125,19 @@ class Open(ReadOnly):
     del mode, mode_b, mode_t
 
     def __init__(self, file: Union[File, PathLink], /):
-        if not isinstance(file, (File, bytes, str)):
+        if file.__class__ not in (bytes, str) and not isinstance(file, File):
             raise ex.NotAFileError(
                 'file can only be an instance of '
                 f'"{__package__}.{File.__name__}" or a path link, '
                 f'not "{file.__class__.__name__}".'
             )
-        self.file = file
-
-    def __getattr__(self, mode: OpenMode, /) -> Closure:
-        try:
-            buffer: Type[BufferedIOBase] = Open.__modes__[mode]
-        except KeyError:
-            raise AttributeError(
-                f"'{self.__class__.__name__}' object has no attribute '{mode}'"
-            ) from None
-        return self.__open__(buffer, mode)
+        setattribute(self, 'file', file)
 
     def __dir__(self) -> Iterable[str]:
+        # The mode methods are set on the class, only hide the internals.
         methods = object.__dir__(self)
         methods.remove('__modes__')
-        methods.remove('__pass__')
-        methods += self.__modes__
+        methods.remove('__open__')
         return methods
 
     def __repr__(self) -> str:
@@ -1276,8 +2145,15 @@ class Open(ReadOnly):
             self.file.name if isinstance(self.file, File) else self.file
         return f'<{__package__}.{self.__class__.__name__} file={filelink!r}>'
 
-    def __open__(self, buffer: Type[BufferedIOBase], mode: OpenMode) -> Closure:
+    @staticmethod
+    def __open__(buffer: Type[BufferedIOBase], mode: OpenMode) -> Closure:
+        # Build the method of an open mode once, when the class is created,
+        # rather than a closure on every attribute access.
+        rawmode: str = mode.replace('_plus', '+')
+        binary: bool = 'b' in mode
+
         def init_buffer_instance(
+                self,
                 *,
                 bufsize:        int                       = DEFAULT_BUFFER_SIZE,
                 encoding:       Optional[str]                       = None,
@@ -1288,14 +2164,10 @@ class Open(ReadOnly):
                 opener:         Optional[Callable[[PathLink, int], int]] = None
         ) -> Union[BufferedIOBase, TextIOWrapper]:
             buf: BufferedIOBase = buffer(
-                raw=FileIO(
-                    file=self.file,
-                    mode=mode.replace('_plus', '+'),
-                    opener=opener
-                ),
+                raw=FileIO(file=self.file, mode=rawmode, opener=opener),
                 buffer_size=bufsize
             )
-            return buf if 'b' in mode else TextIOWrapper(
+            return buf if binary else TextIOWrapper(
                 buffer        =buf,
                 encoding      =encoding,
                 errors        =errors,
@@ -1309,20 +2181,53 @@ class Open(ReadOnly):
 
         return init_buffer_instance
 
+    def copy_to(
+            self,
+            dst: Union[File, PathLink],
+            /, *,
+            length: Optional[int] = None
+    ) -> int:
+        with FileIO(self.file) as fsrc:
+            outfd: int = osopen(dst, O_WRONLY | O_CREAT | O_BINARY, 0o666)
+            try:
+                # Same as `copyregular` (and `shutil.copyfile`).
+                x, y = fstat(fsrc.fileno()), fstat(outfd)
+                if (x.st_dev, x.st_ino) == (y.st_dev, y.st_ino):
+                    raise SameFileError(
+                        f'{self.file!r} and {dst!r} are the same file'
+                    )
+                ftruncate(outfd, 0)
+                copied: int = copyfd(
+                    fsrc.fileno(), outfd, -1 if length is None else length
+                )
+            finally:
+                osclose(outfd)
+        filechanged(dst)
+        return copied
+
+
+for mode, buffer in Open.__modes__.items():
+    setattr(Open, mode, Open.__open__(buffer, mode))
+del mode, buffer
+
 
 class Content(Open):
+    __slots__ = ()
 
     def __dir__(self) -> Iterable[str]:
         return object.__dir__(self)
 
     def __bytes__(self) -> bytes:
-        return self.rb().read()
+        with FileIO(self.file) as f:
+            return f.read()
 
     def __ior__(self, other: Union['Content', bytes], /) -> Self:
         self.write(other)
         return self
 
-    def __iadd__(self, other: Union['Content', bytes], /) -> Self:
+    def __iadd__(
+            self, other: Union['Content', bytes, Sequence[bytes]], /
+    ) -> Self:
         self.append(other)
         return self
 
@@ -1336,26 +2241,38 @@ class Content(Open):
         if isinstance(other, Content):
             if abspath(self.file) == abspath(other.file):
                 return True
-            read1, read2 = self.rb().read, other.rb().read
-            while True:
-                content1 = read1(READ_BUFSIZE)
-                content2 = read2(READ_BUFSIZE)
-                if content1 == content2 == b'':
-                    return True
-                if content1 != content2:
-                    return False
+            x, y = stat(self.file), stat(other.file)
+            if (x.st_dev, x.st_ino) == (y.st_dev, y.st_ino):
+                return True
+            if hassize(x) and hassize(y) and x.st_size != y.st_size:
+                return False
+            with self.rb() as f1, other.rb() as f2:
+                read1, read2 = f1.read, f2.read
+                while True:
+                    content1 = read1(READ_BUFSIZE)
+                    content2 = read2(READ_BUFSIZE)
+                    if content1 != content2:
+                        return False
+                    if not content1:
+                        return True
 
         elif other.__class__ is bytes:
-            start, end = 0, READ_BUFSIZE
-            read1 = self.rb().read
-            while True:
-                content1 = read1(READ_BUFSIZE)
-                if content1 == other[start:end] == b'':
-                    return True
-                if content1 != other[start:end]:
-                    return False
-                start += READ_BUFSIZE
-                end   += READ_BUFSIZE
+            x = stat(self.file)
+            if hassize(x) and x.st_size != len(other):
+                return False
+            # Compare each chunk in place with `startswith`, instead of slicing
+            # a copy of `other` (a memoryview comparison is far slower).
+            start = 0
+            buffer: memoryview = buffers.get(READ_BUFSIZE)
+            with FileIO(self.file) as f1:
+                readinto = f1.readinto
+                while True:
+                    n: int = readinto(buffer)
+                    if not n:
+                        return start == len(other)
+                    if not other.startswith(buffer[:n], start):
+                        return False
+                    start += n
 
         raise TypeError(
             'content type to be equality judgment operation can only be '
@@ -1364,16 +2281,23 @@ class Content(Open):
         )
 
     def __iter__(self) -> Iterator[bytes]:
-        return (line.rstrip(b'\r\n') for line in self.rb())
+        with self.rb() as f:
+            for line in f:
+                yield line.rstrip(b'\r\n')
 
     def __len__(self) -> int:
-        return getsize(self.file)
+        # A `File` may have its status cached (`cache_stat`), but without
+        # following symlinks its status is that of the link, not of the content.
+        return self.file.stat.st_size \
+            if isinstance(self.file, File) and self.file.follow_symlinks \
+            else getsize(self.file)
 
     def __bool__(self) -> bool:
-        return bool(getsize(self.file))
+        return bool(len(self))
 
     def read(self, size: int = -1, /) -> bytes:
-        return self.rb().read(size)
+        with FileIO(self.file) as f:
+            return f.read(size)
 
     def write(self, content: Union['Content', bytes], /) -> int:
         if isinstance(content, Content):
@@ -1382,40 +2306,60 @@ class Content(Open):
                     'source and destination cannot be the same, '
                     f'path "{abspath(self.file)}".'
                 )
-            read, write, count = content.rb().read, self.wb().write, 0
-            while True:
-                content = read(READ_BUFSIZE)
-                if not content:
-                    break
-                count += write(content)
+            with FileIO(content.file) as fsrc, FileIO(self.file, 'wb') as fdst:
+                count: int = copyfd(fsrc.fileno(), fdst.fileno())
         # Beware of original data loss due to write failures (the `content` type
         # error).
         elif content.__class__ is bytes:
-            count = self.wb().write(content)
+            fd: int = osopen(
+                self.file, O_WRONLY | O_CREAT | O_TRUNC | O_BINARY, 0o666
+            )
+            try:
+                count: int = writeall(fd, (content,))
+            finally:
+                osclose(fd)
         else:
             raise TypeError(
                 'content type to be written can only be '
                 f'"{__package__}.{Content.__name__}" or "bytes", '
                 f'not "{content.__class__.__name__}".'
             )
+        filechanged(self.file)
         return count
 
-    def append(self, content: Union['Content', bytes], /) -> int:
+    def append(
+            self, content: Union['Content', bytes, Sequence[bytes]], /
+    ) -> int:
         if isinstance(content, Content):
-            read, write, count = content.rb().read, self.ab().write, 0
-            while True:
-                content = read(READ_BUFSIZE)
-                if not content:
-                    break
-                count += write(content)
-        elif content.__class__ is bytes:
-            count = self.ab().write(content)
+            with FileIO(content.file) as fsrc, FileIO(self.file, 'ab') as fdst:
+                x: stat_result = fstat(fsrc.fileno())
+                y: stat_result = fstat(fdst.fileno())
+                # Appended to itself, the file grows while being read, copy
+                # only what it had.
+                count: int = copyfd(
+                    fsrc.fileno(), fdst.fileno(),
+                    x.st_size if (x.st_dev, x.st_ino) == (y.st_dev, y.st_ino)
+                    else -1
+                )
+        elif content.__class__ is bytes or content.__class__ in (list, tuple) \
+                and all(x.__class__ is bytes for x in content):
+            # One `open` and one `write` (`writev` for a sequence of bytes).
+            fd: int = osopen(
+                self.file, O_WRONLY | O_APPEND | O_CREAT | O_BINARY, 0o666
+            )
+            try:
+                count = writeall(
+                    fd, (content,) if content.__class__ is bytes else content
+                )
+            finally:
+                osclose(fd)
         else:
             raise TypeError(
                 'content type to be appended can only be '
-                f'"{__package__}.{Content.__name__}" or "bytes", '
-                f'not "{content.__class__.__name__}".'
+                f'"{__package__}.{Content.__name__}", "bytes" or a sequence '
+                f'of "bytes", not "{content.__class__.__name__}".'
             )
+        filechanged(self.file)
         return count
 
     def contains(self, subcontent: bytes, /) -> bool:
@@ -1425,49 +2369,107 @@ class Content(Open):
         deviation_index = -len(subcontent) + 1
         deviation_value = b''
 
-        read = self.rb().read
-
-        while True:
-            content = read(READ_BUFSIZE)
-            if not content:
-                return False
-            if subcontent in deviation_value + content:
-                return True
-            deviation_value = content[deviation_index:]
+        with FileIO(self.file) as f:
+            read = f.read
+            while True:
+                content = read(READ_BUFSIZE)
+                if not content:
+                    return False
+                if subcontent in deviation_value + content:
+                    return True
+                deviation_value = content[deviation_index:]
 
     def copy(
             self,
             other: Union['Content', 'SupportsWrite[bytes]'],
             /, *,
-            bufsize: int = READ_BUFSIZE
+            bufsize: int = COPY_BUFSIZE
     ) -> None:
-        write = (other.ab() if isinstance(other, Content) else other).write
-        read = self.rb().read
-
-        while True:
-            content = read(bufsize)
-            if not content:
-                break
-            write(content)
+        with FileIO(self.file) as fsrc:
+            if isinstance(other, Content):
+                with FileIO(other.file, 'ab') as fdst:
+                    x: stat_result = fstat(fsrc.fileno())
+                    y: stat_result = fstat(fdst.fileno())
+                    # Appended to itself, the file grows while being read,
+                    # copy only what it had (see `append`).
+                    copyfd(
+                        fsrc.fileno(), fdst.fileno(),
+                        x.st_size
+                        if (x.st_dev, x.st_ino) == (y.st_dev, y.st_ino)
+                        else -1
+                    )
+                filechanged(other.file)
+            else:
+                sequential(fsrc.fileno())
+                copyfileobj(fsrc, other, bufsize)
 
     def truncate(self, length: int, /) -> None:
         truncate(self.file, length)
+        filechanged(self.file)
 
     def clear(self) -> None:
         truncate(self.file, 0)
+        filechanged(self.file)
 
     def md5(self, salting: bytes = b'') -> str:
-        md5 = hashlib.md5(salting)
-        read = self.rb().read
+        import hashlib
+        with FileIO(self.file) as f:
+            sequential(f.fileno())
+            if sys.version_info >= (3, 11):
+                return hashlib.file_digest(
+                    f, lambda: hashlib.md5(salting)
+                ).hexdigest()
+
+            md5 = hashlib.md5(salting)
+            buffer: memoryview = buffers.get(READ_BUFSIZE)
+            readinto = f.readinto
 
-        while True:
-            content = read(READ_BUFSIZE)
-            if not content:
-                break
-            md5.update(content)
+            while True:
+                n: int = readinto(buffer)
+                if not n:
+                    break
+                md5.update(buffer[:n])
 
         return md5.hexdigest()
 
+    def blake3(self, salting: bytes = b'') -> str:
+        import blake3
+        b3 = blake3.blake3(salting, max_threads=blake3.blake3.AUTO)
+        b3.update_mmap(self.file)
+        return b3.hexdigest()
+
+    def murmur3(self, seed: int = 0) -> str:
+        import mmh3
+        mm3 = mmh3.mmh3_x64_128(seed=seed)
+        with FileIO(self.file) as f:
+            sequential(f.fileno())
+            buffer: memoryview = buffers.get(READ_BUFSIZE)
+            readinto = f.readinto
+            while True:
+                n: int = readinto(buffer)
+                if not n:
+                    break
+                mm3.update(buffer[:n])
+        return mm3.digest().hex()
+
+    @staticmethod
+    def md5_many(
+            files:   Iterable[Union[File, PathLink]],
+            /, *,
+            salting: bytes = b'',
+            workers: int   = 8
+    ) -> List[str]:
+        def md5(file: Union[File, PathLink]) -> str:
+            return Content(file).md5(salting)
+
+        files = list(files)
+        if workers <= 1 or len(files) <= 1:
+            return [md5(file) for file in files]
+
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(min(workers, len(files))) as pool:
+            return list(pool.map(md5, files))
+
     overwrite = write
 
 
@@ -1475,15 +2477,17 @@ class tree:
 
     def __init__(
             self,
-            dirpath:    Optional[PathLink] = None,
+            dirpath:    Optional[PathLink]     = None,
             /, *,
-            level:      int                = float('inf'),
-            downtop:    Optional[bool]     = None,
-            bottom_up:  bool               = UNIQUE,
-            omit_dir:   bool               = False,
-            pure_path:  Optional[bool]     = None,
-            mysophobia: bool               = UNIQUE,
-            shortpath:  bool               = False
+            level:      int                    = float('inf'),
+            downtop:    Optional[bool]         = None,
+            bottom_up:  bool                   = UNIQUE,
+            omit_dir:   bool                   = False,
+            pure_path:  Optional[bool]         = None,
+            mysophobia: bool                   = UNIQUE,
+            shortpath:  bool                   = False,
+            include:    Optional[NamePatterns] = None,
+            exclude:    Optional[NamePatterns] = None
     ):
         if dirpath == b'':
             dirpath: bytes = getcwdb()
@@ -1493,6 +2497,7 @@ class tree:
         self.root = dirpath
 
         if bottom_up is not UNIQUE:
+            import warnings
             warnings.warn(
                 'parameter "bottom_up" will be deprecated soon, replaced to '
                 '"downtop".', stacklevel=2
@@ -1505,8 +2510,11 @@ class tree:
         )(dirpath, level=level)
 
         self.omit_dir = omit_dir
+        self.include  = fnmatcher(include, dirpath.__class__)
+        self.exclude  = fnmatcher(exclude, dirpath.__class__)
 
         if mysophobia is not UNIQUE:
+            import warnings
             warnings.warn(
                 'parameter "mysophobia" will be deprecated soon, replaced to '
                 '"pure_path".', stacklevel=2
@@ -1526,39 +2534,68 @@ class tree:
     def __next__(self) -> Union[Path, PathLink]:
         return next(self.tree)
 
+    # Both walk depth first with a stack of directory listings instead of
+    # recursive generators, through which each path would be passed up one
+    # `yield from` per level of depth.
+
     def topdown(
             self, dirpath: PathLink, /, *, level: int
     ) -> Iterator[Union[Path, PathLink]]:
-        for name in listdir(dirpath):
-            path: PathLink = join(dirpath, name)
-            is_dir: bool = isdir(path)
-            if not (is_dir and self.omit_dir):
-                yield self.path(path, is_dir=is_dir)
-            if level > 1 and is_dir:
-                yield from self.topdown(path, level=level - 1)
+        stack: List[Tuple[Iterator[DirEntry], int]] = \
+            [(iter(scandirs(dirpath)), level)]
+        while stack:
+            entries, level = stack[-1]
+            for entry in entries:
+                if self.exclude and self.exclude(entry.name):
+                    continue
+                is_dir: bool = isdir_entry(entry)
+                if self.yieldable(entry, is_dir=is_dir):
+                    yield self.path(entry, is_dir=is_dir)
+                if level > 1 and is_dir:
+                    stack.append((iter(scandirs(entry.path)), level - 1))
+                    break
+            else:
+                stack.pop()
 
     def downtop(
             self, dirpath: PathLink, /, *, level: int
     ) -> Iterator[Union[Path, PathLink]]:
-        for name in listdir(dirpath):
-            path: PathLink = join(dirpath, name)
-            is_dir: bool = isdir(path)
-            if level > 1 and is_dir:
-                yield from self.downtop(path, level=level - 1)
-            if not (is_dir and self.omit_dir):
-                yield self.path(path, is_dir=is_dir)
+        # Each listing keeps the directory entry it belongs to, yielded after
+        # its contents.
+        stack: List[Tuple[Iterator[DirEntry], int, Optional[DirEntry]]] = \
+            [(iter(scandirs(dirpath)), level, None)]
+        while stack:
+            entries, level, _ = stack[-1]
+            for entry in entries:
+                if self.exclude and self.exclude(entry.name):
+                    continue
+                is_dir: bool = isdir_entry(entry)
+                if level > 1 and is_dir:
+                    stack.append((iter(scandirs(entry.path)), level - 1, entry))
+                    break
+                if self.yieldable(entry, is_dir=is_dir):
+                    yield self.path(entry, is_dir=is_dir)
+            else:
+                entry: Optional[DirEntry] = stack.pop()[2]
+                if entry is not None and self.yieldable(entry, is_dir=True):
+                    yield self.path(entry, is_dir=True)
+
+    def yieldable(self, entry: DirEntry, /, *, is_dir: bool) -> bool:
+        if is_dir and self.omit_dir:
+            return False
+        return self.include is None or bool(self.include(entry.name))
 
     def path(
-            self, path: PathLink, /, *, is_dir: bool
+            self, entry: DirEntry, /, *, is_dir: bool
     ) -> Union[Path, PathLink]:
         if self.pure_path:
-            return self.basepath(path) if self.shortpath else path
+            return self.basepath(entry.path) if self.shortpath else entry.path
         elif is_dir:
-            return Directory(path)
-        elif isfile(path):
-            return File(path)
+            return Directory(entry.path)
+        elif isfile_entry(entry):
+            return File(entry.path)
         else:
-            return Path(path)
+            return Path(entry.path)
 
     def basepath(self, path: PathLink, /) -> PathLink:
         path: PathLink = path.replace(self.root, self.nullchar)
@@ -1567,6 +2604,75 @@ class tree:
         return path
 
 
+async def to_thread(func: Callable, /, *a, **kw) -> Any:
+    import asyncio
+    if sys.version_info >= (3, 9):
+        return await asyncio.to_thread(func, *a, **kw)
+    return await asyncio.get_running_loop().run_in_executor(
+        None, functools.partial(func, *a, **kw)
+    )
+
+
+async def aiterate(
+        func: Callable[..., Iterable], /, *a, **kw
+) -> AsyncIterator[Any]:
+    # Pull the items in batches, one thread hop per item would cost more than
+    # the system calls behind most of them.
+    iterator: Iterator = iter(await to_thread(func, *a, **kw))
+    while True:
+        items: list = await to_thread(list, islice(iterator, 64))
+        if not items:
+            break
+        for item in items:
+            yield item
+
+
+class AsyncPath:
+    __iterators__ = 'tree', 'walk', 'search', 'scandir', 'subpaths'
+
+    def __init__(self, path: Union[PathType, PathLink], /):
+        self.path = path if isinstance(path, Path) else SystemPath(path)
+
+    def __repr__(self) -> str:
+        return (
+            f'<{__package__}.{self.__class__.__name__} '
+            f'name={self.path.name!r}>'
+        )
+
+    def __fspath__(self) -> PathLink:
+        return self.path.name
+
+    def __aiter__(self) -> AsyncIterator[PathType]:
+        return aiterate(self.path.__iter__)
+
+    def __getattr__(self, name: str) -> Any:
+        attr: Any = getattr(self.path.__class__, name, UNIQUE)
+
+        if attr is UNIQUE or name[0] == '_':
+            return getattr(self.path, name)
+
+        if isinstance(attr, property):
+            if name in self.__iterators__:
+                return aiterate(getattr, self.path, name)
+            return to_thread(getattr, self.path, name)
+
+        method: Callable = getattr(self.path, name)
+
+        if not callable(method):
+            return method
+
+        if name in self.__iterators__:
+            @functools.wraps(method)
+            def core(*a, **kw) -> AsyncIterator[Any]:
+                return aiterate(method, *a, **kw)
+        else:
+            @functools.wraps(method)
+            def core(*a, **kw) -> Awaitable[Any]:
+                return to_thread(method, *a, **kw)
+
+        return core
+
+
 class INI:
     def __init__(self, file: File, /):
         self.file = file
@@ -1586,7 +2692,8 @@ class INI:
             default_section:         str                         = 'DEFAULT',
             interpolation:           Optional['Interpolation']   = None,
             converters:              Optional[ConvertersMap]     = None
-    ) -> ConfigParser:
+    ) -> 'ConfigParser':
+        from configparser import ConfigParser
         kw = {}
         if interpolation is not None:
             kw['interpolation'] = interpolation
@@ -1627,6 +2734,7 @@ class CSV:
             quoting:          int            = 0,
             strict:           bool           = False
     ) -> CSVReader:
+        import csv
         return csv.reader(
             Open(self.file).r(encoding=encoding, newline=''),
             dialect,
@@ -1659,6 +2767,7 @@ class CSV:
             raise ex.ParameterError(
                 f'parameter "mode" must be "w" or "a", not {mode!r}.'
             )
+        import csv
         return csv.writer(
             getattr(Open(self.file), mode)(encoding=encoding, newline=''),
             dialect,
@@ -1681,13 +2790,14 @@ class JSON:
     def load(
             self,
             *,
-            cls:               Type[json.JSONDecoder]        = json.JSONDecoder,
+            cls:               Optional[Type['json.JSONDecoder']] = None,
             object_hook:       Optional[JsonObjectHook]      = None,
             parse_float:       Optional[JsonObjectParse]     = None,
             parse_int:         Optional[JsonObjectParse]     = None,
             parse_constant:    Optional[JsonObjectParse]     = None,
             object_pairs_hook: Optional[JsonObjectPairsHook] = None
     ) -> Any:
+        import json
         return json.loads(
             self.file.content,
             cls              =cls,
@@ -1707,13 +2817,14 @@ class JSON:
             ensure_ascii:   bool                           = True,
             check_circular: bool                           = True,
             allow_nan:      bool                           = True,
-            cls:            Type[json.JSONEncoder]         = json.JSONEncoder,
+            cls:            Optional[Type['json.JSONEncoder']] = None,
             indent:         Optional[Union[int, str]]      = None,
             separators:     Optional[Tuple[str, str]]      = None,
             default:        Optional[Callable[[Any], Any]] = None,
             sort_keys:      bool                           = False,
             **kw
     ) -> None:
+        import json
         return json.dump(
             obj,
             Open(self.file).w(encoding=encoding),
@@ -1733,17 +2844,22 @@ class JSON:
 class YAML:
 
     def __init__(self, file: File, /):
-        if yaml is None:
+        try:
+            import yaml
+        except ModuleNotFoundError:
             raise ModuleNotFoundError(
                 'dependency has not been installed, '
                 'run `pip3 install systempath[pyyaml]`.'
-            )
+            ) from None
         self.file = file
 
     def load(self, loader: Optional['YamlLoader'] = None) -> Any:
-        return yaml.load(FileIO(self.file), loader or yaml.SafeLoader)
+        import yaml
+        with FileIO(self.file) as f:
+            return yaml.load(f, loader or yaml.SafeLoader)
 
     def load_all(self, loader: Optional['YamlLoader'] = None) -> Iterator[Any]:
+        import yaml
         return yaml.load_all(FileIO(self.file), loader or yaml.SafeLoader)
 
     def dump(
@@ -1766,6 +2882,7 @@ class YAML:
             tags:               Optional[Mapping[str, str]] = None,
             sort_keys:          bool                        = True
     ) -> None:
+        import yaml
         return yaml.dump_all(
             [data],
             Open(self.file).w(encoding=encoding),
@@ -1805,6 +2922,7 @@ class YAML:
             tags:               Optional[Mapping[str, str]] = None,
             sort_keys:          bool                        = True
     ) -> None:
+        import yaml
         return yaml.dump_all(
             documents,
             Open(self.file).w(encoding=encoding),
@@ -1826,6 +2944,7 @@ class YAML:
 
 
 class SystemPath(Directory, File):
+    __slots__ = ()
 
     def __init__(
             self,
@@ -1834,7 +2953,8 @@ class SystemPath(Directory, File):
             autoabs:         bool          = False,
             strict:          bool          = False,
             dir_fd:          Optional[int] = None,
-            follow_symlinks: bool          = True
+            follow_symlinks: bool          = True,
+            cache_stat:      bool          = False
     ):
         Path.__init__(
             self,
@@ -1842,7 +2962,8 @@ class SystemPath(Directory, File):
             autoabs        =autoabs,
             strict         =strict,
             dir_fd         =dir_fd,
-            follow_symlinks=follow_symlinks
+            follow_symlinks=follow_symlinks,
+            cache_stat     =cache_stat
         )
 
     __new__     = Path.__new__
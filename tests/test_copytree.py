@@ -0,0 +1,72 @@
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+# Imported lazily by `copytree`, the child process below may not be allowed
+# to read the standard library once it dropped its privileges.
+from concurrent.futures import ThreadPoolExecutor  # noqa: F401
+
+import systempath
+
+
+@unittest.skipUnless(hasattr(os, 'fork'), 'requires os.fork')
+class TestCopytreeReadOnly(unittest.TestCase):
+    # As root the permissions are not checked, the copy runs in a child
+    # process that drops to the "nobody" user.
+    nobody = 65534
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.src = os.path.join(self.tmp, 'src')
+        self.dst = os.path.join(self.tmp, 'dst')
+        os.mkdir(self.src)
+        for i in range(200):
+            with open(os.path.join(self.src, f'f{i}'), 'wb') as f:
+                f.write(b'x' * i)
+        os.chmod(self.src, 0o555)
+        if os.geteuid() == 0:
+            os.chown(self.tmp, self.nobody, self.nobody)
+
+    def tearDown(self):
+        for path in self.src, self.dst:
+            if os.path.isdir(path):
+                os.chmod(path, 0o755)
+        shutil.rmtree(self.tmp)
+
+    def copytree(self, **kw):
+        pid = os.fork()
+        if pid == 0:
+            code = 1
+            try:
+                if os.geteuid() == 0:
+                    os.setgid(self.nobody)
+                    os.setuid(self.nobody)
+                systempath.Directory(self.src).copytree(self.dst, **kw)
+                code = 0
+            except BaseException:
+                import traceback
+                traceback.print_exc()
+            finally:
+                sys.stderr.flush()
+                os._exit(code)
+        _, status = os.waitpid(pid, 0)
+        # Killed by a signal is a failure too (`os.waitstatus_to_exitcode`
+        # needs Python 3.9).
+        return os.WEXITSTATUS(status) if os.WIFEXITED(status) else -1
+
+    def check(self, **kw):
+        self.assertEqual(self.copytree(**kw), 0)
+        self.assertEqual(len(os.listdir(self.dst)), 200)
+        self.assertEqual(os.stat(self.dst).st_mode & 0o777, 0o555)
+        self.assertEqual(os.path.getsize(os.path.join(self.dst, 'f199')), 199)
+
+    def test_concurrent(self):
+        self.check(workers=8)
+
+    def test_serial(self):
+        self.check(workers=1)
+
+
+if __name__ == '__main__':
+    unittest.main()